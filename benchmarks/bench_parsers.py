@@ -0,0 +1,130 @@
+"""
+Benchmark the timedtext parser backends on saved fixtures.
+
+Parses every timedtext document with each available backend (stdlib and, if
+installed, lxml), once as a complete document and once streamed through the
+pull parser. Saved watch pages are used to compare locating the caption JSON
+with the json_extractor scanner against an lxml.html parse.
+
+Pass timedtext XML files and watch page HTML files (or directories of them);
+with no arguments a synthetic 20000-segment transcript and a synthetic watch
+page are used.
+
+Usage:
+    python benchmarks/bench_parsers.py [FILE.xml | PAGE.html | DIR ...] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import parsers
+from fetched_transcript import FetchedTranscript
+from json_extractor import extract_json_object
+from youtube_transcript import YouTubeTranscriptApi
+from bench_player_response import synthetic_page
+
+CHUNK_SIZE = 64 * 1024
+
+
+def synthetic_timedtext(segments=20000):
+    """
+    Build a timedtext document with entities and markup in the texts.
+    """
+    body = ''.join(
+        f'<text start="{i * 2.5:.2f}" dur="2.5">word &amp;amp; {i} &lt;i&gt;caption&lt;/i&gt; héllo</text>'
+        for i in range(segments)
+    )
+    return ('<?xml version="1.0" encoding="utf-8" ?><transcript>' + body + '</transcript>').encode('utf-8')
+
+
+def load_fixtures(paths):
+    documents, pages = [], []
+    for path in paths:
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path))]
+        else:
+            files = [path]
+        for file_path in files:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            if file_path.endswith(('.html', '.htm')):
+                pages.append((os.path.basename(file_path), data.decode('utf-8')))
+            elif file_path.endswith('.xml'):
+                documents.append((os.path.basename(file_path), data))
+    return documents, pages
+
+
+def full_parse(transcript, data):
+    return transcript._process_transcript_data(data.decode('utf-8'))
+
+
+def stream_parse(transcript, data):
+    chunks = (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+    return transcript._process_transcript_stream(chunks)
+
+
+def scanner_locate(html_content):
+    player_response = extract_json_object(html_content, 'ytInitialPlayerResponse')
+    if player_response:
+        return YouTubeTranscriptApi._find_captions_data(player_response)
+    return None
+
+
+def lxml_html_locate(html_content):
+    from lxml import html as lxml_html
+
+    for script in lxml_html.fromstring(html_content).iter('script'):
+        if script.text and 'ytInitialPlayerResponse' in script.text:
+            return scanner_locate(script.text)
+    return None
+
+
+def time_per_call(func, args, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixtures', nargs='*', help='Timedtext XML files, watch page HTML files or directories')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per fixture (default: 5)')
+    args = parser.parse_args()
+
+    if args.fixtures:
+        documents, pages = load_fixtures(args.fixtures)
+    else:
+        documents, pages = [('synthetic', synthetic_timedtext())], [('synthetic', synthetic_page())]
+
+    backends = ['stdlib'] + (['lxml'] if parsers.lxml_etree is not None else [])
+    transcript = FetchedTranscript('XXXXXXXXXXX', 'en', 'English', '', False, False, [])
+
+    print(f"{'document':<30} {'size':>9} {'backend':>8} {'full ms':>9} {'stream ms':>10} {'segments':>9}")
+    for name, data in documents:
+        for backend in backends:
+            parsers.set_parser_backend(backend)
+            full_ms, segments = time_per_call(full_parse, (transcript, data), args.repeat)
+            stream_ms, streamed = time_per_call(stream_parse, (transcript, data), args.repeat)
+            assert streamed == segments
+            print(f"{name[:30]:<30} {len(data):>9} {backend:>8} {full_ms:>9.2f} {stream_ms:>10.2f} {len(segments):>9}")
+
+    if not pages:
+        return
+    print()
+    print(f"{'page':<30} {'size':>9} {'scanner ms':>11} {'lxml.html ms':>13}")
+    for name, html_content in pages:
+        scanner_ms, _ = time_per_call(scanner_locate, (html_content,), args.repeat)
+        if parsers.lxml_etree is not None:
+            lxml_ms, _ = time_per_call(lxml_html_locate, (html_content,), args.repeat)
+            lxml_column = f"{lxml_ms:>13.2f}"
+        else:
+            lxml_column = f"{'n/a':>13}"
+        print(f"{name[:30]:<30} {len(html_content):>9} {scanner_ms:>11.2f} {lxml_column}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark ytInitialPlayerResponse extraction on saved watch pages.
+
+Compares the previous lazy-regex cascade with the single-pass scanner in
+json_extractor. Pass saved watch page HTML files (or directories of them); with
+no arguments a synthetic ~1 MB watch page is used.
+
+Usage:
+    python benchmarks/bench_player_response.py [PAGE.html | DIR ...] [--repeat N]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from json_extractor import extract_json_object
+from youtube_transcript import YouTubeTranscriptApi
+
+
+LEGACY_PATTERNS = [
+    r'"captions":\s*\{[^}]*"playerCaptionsTracklistRenderer":\s*(\{.*?\})',
+    r'"playerCaptionsTracklistRenderer":\s*(\{.*?"captionTracks".*?\})',
+    r'ytInitialPlayerResponse["\']?:\s*(\{.*?\})',
+    r'var\s+ytInitialPlayerResponse\s*=\s*(\{.*?\});',
+    r'"captionTracks":\s*\[(.*?)\]',
+    r'"playerCaptionsRenderer":\s*(\{.*?\})',
+    r'"captions":(\{.*?"playerCaptionsTracklistRenderer".*?\})',
+    r'ytInitialPlayerResponse":\s*(\{.*?\})\s*[,}]'
+]
+
+
+def legacy_extract(html_content):
+    """
+    The regex cascade previously used by _extract_transcript_data.
+    """
+    for pattern in LEGACY_PATTERNS:
+        match = re.search(pattern, html_content)
+        if match:
+            try:
+                data = json.loads(match.group(1))
+                captions_data = YouTubeTranscriptApi._find_captions_data(data)
+                if captions_data:
+                    return captions_data
+            except (json.JSONDecodeError, KeyError):
+                continue
+    return None
+
+
+def scanner_extract(html_content):
+    """
+    The single-pass extraction used now.
+    """
+    player_response = extract_json_object(html_content, 'ytInitialPlayerResponse')
+    if player_response:
+        return YouTubeTranscriptApi._find_captions_data(player_response)
+    return None
+
+
+def synthetic_page():
+    """
+    Build a watch page of realistic size and shape.
+    """
+    tracks = [
+        {
+            'baseUrl': f'https://www.youtube.com/api/timedtext?v=XXXXXXXXXXX&lang=l{i}&sparams=ip,ipbits,expire',
+            'name': {'simpleText': f'Language {i} {{auto}}'},
+            'languageCode': f'l{i}',
+            'kind': 'asr' if i % 2 else ''
+        }
+        for i in range(20)
+    ]
+    player_response = {
+        'responseContext': {'serviceTrackingParams': [{'service': 'GFEEDBACK', 'params': [{'key': 'k', 'value': 'v'}] * 50}]},
+        'playabilityStatus': {'status': 'OK'},
+        'streamingData': {'formats': [{'itag': i, 'url': 'https://example.invalid/' + 'x' * 400, 'mimeType': 'video/mp4; codecs="avc1"'} for i in range(200)]},
+        'captions': {'playerCaptionsTracklistRenderer': {
+            'captionTracks': tracks,
+            'translationLanguages': [{'languageCode': f't{i}', 'languageName': {'simpleText': f'T {i}'}} for i in range(120)]
+        }},
+        'videoDetails': {'shortDescription': 'Code: if (x) { run(); }; braces and "quotes" \\ inside strings ' * 200},
+        'microformat': {'playerMicroformatRenderer': {'description': {'simpleText': 'x' * 5000}}}
+    }
+    filler = '<div class="style-scope">{"a":{"b":[1,2,3]}}</div>\n' * 8000
+    initial_data = json.dumps({'contents': {'items': [{'videoId': 'abcdefghijk', 'title': 'y' * 100}] * 2000}})
+    return (
+        '<!DOCTYPE html><html><head><script>var ytcfg={"INNERTUBE_API_KEY":"KEY"};</script></head><body>'
+        + filler
+        + '<script>var ytInitialPlayerResponse = ' + json.dumps(player_response) + ';</script>'
+        + '<script>var ytInitialData = ' + initial_data + ';</script>'
+        + filler
+        + '</body></html>'
+    )
+
+
+def load_pages(paths):
+    pages = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(('.html', '.htm')):
+                    pages.append((name, open(os.path.join(path, name), encoding='utf-8').read()))
+        else:
+            pages.append((os.path.basename(path), open(path, encoding='utf-8').read()))
+    return pages
+
+
+def time_per_call(func, html_content, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(html_content)
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages', nargs='*', help='Saved watch page HTML files or directories')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per page (default: 20)')
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages) if args.pages else [('synthetic', synthetic_page())]
+
+    print(f"{'page':<30} {'size':>9} {'legacy ms':>10} {'scanner ms':>11} {'legacy ok':>10} {'scanner ok':>11}")
+    for name, html_content in pages:
+        legacy_ms, legacy_result = time_per_call(legacy_extract, html_content, args.repeat)
+        scanner_ms, scanner_result = time_per_call(scanner_extract, html_content, args.repeat)
+        print(
+            f"{name[:30]:<30} {len(html_content):>9} {legacy_ms:>10.2f} {scanner_ms:>11.2f} "
+            f"{str(bool(legacy_result)):>10} {str(bool(scanner_result)):>11}"
+        )
+
+
+if __name__ == '__main__':
+    main()
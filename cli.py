@@ -3,7 +3,9 @@ import sys
 import json
 import os
 import re
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 # Add src directory to path
@@ -11,7 +13,50 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from youtube_transcript import YouTubeTranscriptApi
 from formatters import get_formatter
-from exceptions import TranscriptRetrievalError
+from transport import Transport
+from rate_limiter import get_default_rate_limiter
+from proxy_pool import ProxyPool
+from download_manifest import DownloadManifest
+from channel_sync import ChannelSyncState
+from channel_videos import iter_channel_video_ids
+from exceptions import TranscriptRetrievalError, TranscriptNotFound
+
+
+def build_proxies(proxy_urls: Optional[List[str]]):
+    """
+    Build the proxy configuration from --proxy arguments.
+
+    Args:
+        proxy_urls: Proxy URLs given on the command line
+
+    Returns:
+        None, a proxies dict for a single URL, or a ProxyPool for several
+    """
+    if not proxy_urls:
+        return None
+    if len(proxy_urls) == 1:
+        return {
+            'http': proxy_urls[0],
+            'https': proxy_urls[0]
+        }
+    return ProxyPool(proxy_urls)
+
+
+def track_type_filters(args) -> dict:
+    """
+    Translate the --generated-only/--manual-only/--exclude-* flags into the
+    allow_manual/allow_generated arguments of get_transcript.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Keyword arguments for YouTubeTranscriptApi.get_transcript and TranscriptList.plan
+    """
+    return {
+        'allow_manual': not (args.generated_only or args.exclude_manual),
+        'allow_generated': not (args.manual_only or args.exclude_generated)
+    }
 
 
 def extract_video_id(url_or_id: str) -> str:
@@ -40,228 +85,223 @@ def extract_video_id(url_or_id: str) -> str:
     raise ValueError(f"Could not extract video ID from: {url_or_id}")
 
 
-def build_youtube_channel_url(username: str) -> str:
-    """
-    Build YouTube channel URL from username.
-
-    Args:
-        username: YouTube username (with or without @)
-
-    Returns:
-        YouTube channel URL
+def download_channel_transcripts(username: str, max_count: int, args) -> None:
     """
-    # Clean username
-    username = username.strip()
-
-    # If it's already a full URL, return as is
-    if username.startswith('http'):
-        return username
-
-    # If it starts with UC (channel ID), use channel format
-    if username.startswith('UC') and len(username) == 24:
-        return f"https://www.youtube.com/channel/{username}/videos?sort=dd"
-
-    # Remove @ if present
-    if username.startswith('@'):
-        username = username[1:]
-
-    # Use handle format (newer format) with sort parameter to get latest videos
-    return f"https://www.youtube.com/@{username}/videos?sort=dd"
-
+    Download transcripts from a YouTube channel's latest videos.
 
-def get_channel_video_ids(username: str, max_count: int = 10) -> List[str]:
-    """
-    Get video IDs from a YouTube channel using multiple page requests.
+    Each transcript is saved as <video_id>.<ext> and every finished video is
+    checkpointed in the manifest of the output directory; with --resume,
+    videos it lists as downloaded are skipped and only the rest is fetched.
+    With --sync, the channel's sync state limits the run to videos not
+    synced before and, with --recheck-generated, to recent videos whose
+    auto-generated transcript may still change.
 
     Args:
         username: YouTube username (with or without @)
-        max_count: Maximum number of video IDs to return
-
-    Returns:
-        List of video IDs
+        max_count: Maximum number of videos to process (with --sync, the number of
+            latest videos checked at least)
+        args: Parsed command line arguments
 
     Raises:
-        RuntimeError: If channel extraction fails
-        ValueError: If no videos found
+        RuntimeError: If the video list cannot be retrieved
     """
-    channel_url = build_youtube_channel_url(username)
-
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        all_video_ids = []
-
-        # Try both videos and uploads URL formats with sort parameter for latest videos
-        urls_to_try = [
-            channel_url,
-            channel_url.replace('/videos?sort=dd', '/uploads?sort=dd'),
-            channel_url.replace('/videos?sort=dd', '?sort=dd'),
-            channel_url.replace('@', 'c/'),
-            channel_url.replace('@', 'channel/').replace('/videos?sort=dd', '/videos?sort=dd'),
-        ]
-
-        for url in urls_to_try:
-            try:
-                response = requests.get(url, headers=headers)
-                response.raise_for_status()
-
-                # Extract video IDs from HTML using multiple regex patterns
-                video_id_patterns = [
-                    r'"videoId":"([a-zA-Z0-9_-]{11})"',
-                    r'/watch\?v=([a-zA-Z0-9_-]{11})',
-                    r'"watchEndpoint":{"videoId":"([a-zA-Z0-9_-]{11})"',
-                    r'watch\?v=([a-zA-Z0-9_-]{11})',
-                    r'"url":"/watch\?v=([a-zA-Z0-9_-]{11})"',
-                    r'href="/watch\?v=([a-zA-Z0-9_-]{11})"'
-                ]
-
-                for pattern in video_id_patterns:
-                    matches = re.findall(pattern, response.text)
-                    all_video_ids.extend(matches)
-
-            except:
-                continue
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_video_ids = []
-        for video_id in all_video_ids:
-            if video_id not in seen:
-                seen.add(video_id)
-                unique_video_ids.append(video_id)
-
-        # If we still don't have enough, try to get more with a different approach
-        if len(unique_video_ids) < max_count:
-            try:
-                main_url = channel_url.replace('/videos?sort=dd', '?sort=dd')
-                response = requests.get(main_url, headers=headers)
-                response.raise_for_status()
-
-                for pattern in video_id_patterns:
-                    matches = re.findall(pattern, response.text)
-                    for match in matches:
-                        if match not in seen:
-                            seen.add(match)
-                            unique_video_ids.append(match)
-            except:
-                pass
-
-        # Limit to requested count
-        unique_video_ids = unique_video_ids[:max_count]
-
-        if not unique_video_ids:
-            raise ValueError(f"No videos found for username: {username}")
-
-        return unique_video_ids
-
-    except requests.RequestException as e:
-        raise RuntimeError(f"Failed to fetch channel page: {e}")
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract video IDs: {e}")
+    print(f"Getting video list for {username}...")
 
+    # Setup proxy configuration
+    proxies = build_proxies(args.proxy)
 
-def download_channel_transcripts(username: str, max_count: int, args) -> None:
-    """
-    Download transcripts from a YouTube channel's latest videos.
+    jobs = max(args.jobs, 1)
 
-    Args:
-        username: YouTube username (with or without @)
-        max_count: Maximum number of videos to process
-        args: Parsed command line arguments
+    # Reuse one pooled connection set for the listing and every video, sized
+    # so every job keeps its own connection, throttled by the shared adaptive
+    # rate limiter
+    transport = Transport(pool_maxsize=max(jobs, 10), rate_limiter=get_default_rate_limiter())
 
-    Raises:
-        RuntimeError: If yt-dlp fails or other errors occur
-    """
-    print(f"Getting video list for {username}...")
+    clean_username = username.replace('@', '').replace('/', '_').replace('\\', '_')
+    output_dir = clean_username
 
-    # Get video IDs
+    sync_state = None
+    if args.sync:
+        sync_state = ChannelSyncState.for_directory(output_dir, channel=username)
+        manifest_path = os.path.join(output_dir, DownloadManifest.FILENAME)
+        if sync_state.last_synced_at is None and os.path.exists(manifest_path):
+            # Videos an earlier plain or --resume run downloaded are not new
+            with DownloadManifest(manifest_path) as previous_downloads:
+                sync_state.seed(
+                    entry for entry in previous_downloads
+                    if previous_downloads.is_complete(entry['video_id'])
+                )
+
+    # Get video IDs, following the channel's continuation pages as needed; a
+    # sync reads past max_count until it reaches videos it already knows
     try:
-        video_ids = get_channel_video_ids(username, max_count)
-        print(f"Found {len(video_ids)} videos")
-    except Exception as e:
+        listing = iter_channel_video_ids(
+            username,
+            max_count=None if sync_state is not None else max_count,
+            transport=transport,
+            proxies=proxies,
+            cookies=args.cookies
+        )
+        if sync_state is not None:
+            video_ids = sync_state.collect(listing, max_count)
+        else:
+            video_ids = list(listing)
+    except TranscriptRetrievalError as e:
+        transport.close()
         raise RuntimeError(f"Failed to get video list: {e}")
+    if not video_ids:
+        transport.close()
+        raise RuntimeError(f"Failed to get video list: No videos found for username: {username}")
+    print(f"Found {len(video_ids)} videos")
 
     # Create output directory
-    clean_username = username.replace('@', '').replace('/', '_').replace('\\', '_')
-    output_dir = clean_username
-
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"Created directory: {output_dir}")
 
-    # Setup proxy configuration
-    proxies = None
-    if args.proxy:
-        proxies = {
-            'http': args.proxy,
-            'https': args.proxy
-        }
-
-    # Process each video
-    successful_downloads = 0
-    failed_downloads = []
+    # Formatter, its options and the file extension are the same for every video
+    formatter = get_formatter(args.format)
+
+    formatter_kwargs = {}
+    if args.format == 'pretty':
+        formatter_kwargs['show_timestamps'] = True
+        formatter_kwargs['max_chars_per_line'] = 80
+    elif args.format == 'json':
+        formatter_kwargs['indent'] = 2
+        formatter_kwargs['ensure_ascii'] = False
+    elif args.format == 'text':
+        formatter_kwargs['separator'] = ' '
+
+    file_ext = 'txt'
+    if args.format == 'json':
+        file_ext = 'json'
+    elif args.format == 'srt':
+        file_ext = 'srt'
+    elif args.format == 'vtt':
+        file_ext = 'vtt'
+
+    manifest = DownloadManifest.for_directory(output_dir)
+
+    pending = list(enumerate(video_ids, 1))
+    skipped = 0
+    recheck_ids = set()
+    sync_counts = {'rechecked': 0, 'changed': 0}
+    if sync_state is not None:
+        new_ids, recheck_ids = sync_state.pending(video_ids, recheck_generated=args.recheck_generated * 3600)
+        sync_state.mark_seen(video_ids)
+        due = set(new_ids).union(recheck_ids)
+        recheck_ids = set(recheck_ids)
+        pending = [(i, video_id) for i, video_id in pending if video_id in due]
+        skipped = len(video_ids) - len(pending)
+        print(f"Sync: {len(new_ids)} new, {len(recheck_ids)} to re-check, {skipped} up to date")
+    elif args.resume:
+        pending = [(i, video_id) for i, video_id in pending if not manifest.is_complete(video_id)]
+        skipped = len(video_ids) - len(pending)
+        print(f"Resuming: {skipped} of {len(video_ids)} videos already downloaded")
+
+    print_lock = threading.Lock()
+
+    def download_video(i: int, video_id: str) -> Optional[str]:
+        """
+        Fetch, format and save the transcript of one video.
 
-    for i, video_id in enumerate(video_ids, 1):
-        print(f"Processing video {i}/{len(video_ids)}: {video_id}")
+        Returns:
+            None on success, otherwise the error message
+        """
+        header = f"Processing video {i}/{len(video_ids)}: {video_id}"
+        if jobs == 1:
+            print(header)
 
+        started = time.time()
         try:
-            # Get transcript for this video
-            transcript = YouTubeTranscriptApi.get_transcript(
+            # Pick the track through the plan, so the manifest can record it
+            transcript_list = YouTubeTranscriptApi.list_transcripts(
                 video_id,
-                languages=args.languages,
                 proxies=proxies,
                 cookies=args.cookies,
-                preserve_formatting=args.preserve_formatting
+                transport=transport
             )
+            plan = transcript_list.plan(args.languages, **track_type_filters(args))
+            if not plan:
+                raise TranscriptNotFound(video_id, args.languages)
 
-            # Format transcript
-            formatter = get_formatter(args.format)
-
-            # Prepare formatter options
-            formatter_kwargs = {}
-            if args.format == 'pretty':
-                formatter_kwargs['show_timestamps'] = True
-                formatter_kwargs['max_chars_per_line'] = 80
-            elif args.format == 'json':
-                formatter_kwargs['indent'] = 2
-                formatter_kwargs['ensure_ascii'] = False
-            elif args.format == 'text':
-                formatter_kwargs['separator'] = ' '
+            transcript = plan.transcript.fetch(preserve_formatting=args.preserve_formatting)
 
             formatted_transcript = formatter.format_transcript(transcript, **formatter_kwargs)
 
-            # Determine file extension
-            file_ext = 'txt'
-            if args.format == 'json':
-                file_ext = 'json'
-            elif args.format == 'srt':
-                file_ext = 'srt'
-            elif args.format == 'vtt':
-                file_ext = 'vtt'
-
-            # Save to file
-            filename = f"{i}.{file_ext}"
+            # Save to file, named after the video so reruns overwrite the same file
+            filename = f"{video_id}.{file_ext}"
             filepath = os.path.join(output_dir, filename)
 
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(formatted_transcript)
 
-            print(f"  Success: Saved {filepath}")
-            successful_downloads += 1
+            entry = manifest.record_success(
+                video_id,
+                filename,
+                formatted_transcript,
+                language_code=plan.language_code,
+                kind=plan.kind,
+                elapsed=time.time() - started
+            )
+            result, error = f"  Success: Saved {filepath}", None
 
         except TranscriptRetrievalError as e:
-            print(f"  Failed: No transcript for {video_id}: {e}")
-            failed_downloads.append((video_id, str(e)))
+            result, error = f"  Failed: No transcript for {video_id}: {e}", str(e)
+            entry = manifest.record_failure(video_id, error, elapsed=time.time() - started)
         except Exception as e:
-            print(f"  Error: Unexpected error for {video_id}: {e}")
-            failed_downloads.append((video_id, str(e)))
+            result, error = f"  Error: Unexpected error for {video_id}: {e}", str(e)
+            entry = manifest.record_failure(video_id, error, elapsed=time.time() - started)
+
+        # Parallel jobs print header and result together once a video is done
+        with print_lock:
+            if sync_state is not None:
+                changed = sync_state.record(entry)
+                if video_id in recheck_ids:
+                    sync_counts['rechecked'] += 1
+                    sync_counts['changed'] += changed
+                    if changed:
+                        result += " (transcript changed)"
+            if jobs > 1:
+                print(header)
+            print(result)
+        return error
+
+    # Process each video
+    try:
+        if jobs == 1:
+            errors = [download_video(i, video_id) for i, video_id in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(download_video, i, video_id) for i, video_id in pending]
+                try:
+                    errors = [future.result() for future in futures]
+                except KeyboardInterrupt:
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        manifest.close()
+        transport.close()
+        if sync_state is not None:
+            sync_state.save()
+
+    successful_downloads = errors.count(None)
+    failed_downloads = [
+        (video_id, error)
+        for (_, video_id), error in zip(pending, errors)
+        if error is not None
+    ]
 
     # Summary
     print(f"\nDownload completed!")
     print(f"Successfully downloaded: {successful_downloads}")
     print(f"Failed downloads: {len(failed_downloads)}")
+    if args.sync:
+        print(f"Up to date: {skipped}")
+        print(f"Re-checked: {sync_counts['rechecked']} (changed: {sync_counts['changed']})")
+    elif args.resume:
+        print(f"Skipped (already downloaded): {skipped}")
 
     if failed_downloads:
         print("\nFailed videos:")
@@ -288,6 +328,9 @@ Examples:
   %(prog)s dQw4w9WgXcQ --list-transcripts
   %(prog)s --username @MrBeast --count 50
   %(prog)s --username pewdiepie -n 20 --format json
+  %(prog)s --username @MrBeast --count 1000 --jobs 8
+  %(prog)s --username @MrBeast --count 100 --resume
+  %(prog)s --username @MrBeast --count 30 --sync --recheck-generated 48
         """
     )
     
@@ -306,7 +349,34 @@ Examples:
         '--count', '-n',
         type=int,
         default=10,
-        help='Number of latest videos to download transcripts from (default: 10, max: 100)'
+        help='Number of latest videos to download transcripts from (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of videos downloaded in parallel with --username (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='With --username, skip videos the manifest of the output directory lists as downloaded'
+    )
+    
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='With --username, download only videos not synced to the output directory before'
+    )
+    
+    parser.add_argument(
+        '--recheck-generated',
+        type=float,
+        default=0,
+        metavar='HOURS',
+        help='With --sync, re-download auto-generated transcripts of videos first seen within HOURS; videos found by the first sync are not re-checked (default: 0, off)'
     )
     
     parser.add_argument(
@@ -353,7 +423,8 @@ Examples:
     
     parser.add_argument(
         '--proxy',
-        help='Proxy URL (e.g., http://proxy:8080)'
+        action='append',
+        help='Proxy URL (e.g., http://proxy:8080); repeat --proxy to rotate several URLs per request'
     )
     
     parser.add_argument(
@@ -386,8 +457,33 @@ Examples:
             sys.exit(1)
 
         # Validate count
-        if args.count < 1 or args.count > 100:
-            print("Error: Count must be between 1 and 100", file=sys.stderr)
+        if args.count < 1:
+            print("Error: Count must be at least 1", file=sys.stderr)
+            sys.exit(1)
+
+        if args.jobs < 1:
+            print("Error: Jobs must be at least 1", file=sys.stderr)
+            sys.exit(1)
+
+        if args.recheck_generated < 0:
+            print("Error: --recheck-generated must not be negative", file=sys.stderr)
+            sys.exit(1)
+
+        if args.recheck_generated and not args.sync:
+            print("Error: --recheck-generated requires --sync", file=sys.stderr)
+            sys.exit(1)
+
+        # Validate track type filters, for channel and single video mode alike
+        if args.generated_only and args.manual_only:
+            print("Error: Cannot specify both --generated-only and --manual-only", file=sys.stderr)
+            sys.exit(1)
+
+        if args.exclude_generated and args.exclude_manual:
+            print("Error: Cannot exclude both generated and manual transcripts", file=sys.stderr)
+            sys.exit(1)
+
+        if (args.generated_only and args.exclude_generated) or (args.manual_only and args.exclude_manual):
+            print("Error: No transcripts available after applying filters", file=sys.stderr)
             sys.exit(1)
 
         # Handle username mode (bulk download)
@@ -405,19 +501,17 @@ Examples:
         video_id = extract_video_id(args.video)
         
         # Setup proxy configuration
-        proxies = None
-        if args.proxy:
-            proxies = {
-                'http': args.proxy,
-                'https': args.proxy
-            }
+        proxies = build_proxies(args.proxy)
+
+        transport = Transport(rate_limiter=get_default_rate_limiter())
             
         # List transcripts if requested
         if args.list_transcripts:
             transcript_list = YouTubeTranscriptApi.list_transcripts(
                 video_id,
                 proxies=proxies,
-                cookies=args.cookies
+                cookies=args.cookies,
+                transport=transport
             )
             
             print(f"Available transcripts for video {video_id}:")
@@ -441,51 +535,18 @@ Examples:
                     
             return
             
-        # Get transcript
-        if args.generated_only and args.manual_only:
-            print("Error: Cannot specify both --generated-only and --manual-only", file=sys.stderr)
-            sys.exit(1)
-            
-        if args.exclude_generated and args.exclude_manual:
-            print("Error: Cannot exclude both generated and manual transcripts", file=sys.stderr)
-            sys.exit(1)
-            
+        # Type filters and language preferences are resolved together:
+        # one track listing and one timedtext fetch
         transcript = YouTubeTranscriptApi.get_transcript(
             video_id,
             languages=args.languages,
             proxies=proxies,
             cookies=args.cookies,
-            preserve_formatting=args.preserve_formatting
+            preserve_formatting=args.preserve_formatting,
+            transport=transport,
+            **track_type_filters(args)
         )
         
-        # Filter transcript based on type preferences
-        if args.generated_only or args.manual_only or args.exclude_generated or args.exclude_manual:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(
-                video_id,
-                proxies=proxies,
-                cookies=args.cookies
-            )
-            
-            if args.generated_only:
-                transcript_obj = transcript_list.find_generated_transcript(args.languages or ['en'])
-            elif args.manual_only:
-                transcript_obj = transcript_list.find_manually_created_transcript(args.languages or ['en'])
-            else:
-                # Use exclude filters
-                available_transcripts = list(transcript_list)
-                if args.exclude_generated:
-                    available_transcripts = [t for t in available_transcripts if not t.is_generated]
-                if args.exclude_manual:
-                    available_transcripts = [t for t in available_transcripts if t.is_generated]
-                    
-                if not available_transcripts:
-                    print("Error: No transcripts available after applying filters", file=sys.stderr)
-                    sys.exit(1)
-                    
-                transcript_obj = available_transcripts[0]
-                
-            transcript = transcript_obj.fetch(preserve_formatting=args.preserve_formatting)
-        
         # Format transcript
         formatter = get_formatter(args.format)
         
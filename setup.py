@@ -56,6 +56,9 @@ setup(
             "flake8>=3.8",
             "mypy>=0.800",
         ],
+        "async": [
+            "aiohttp>=3.7",
+        ],
         "docs": [
             "sphinx>=4.0",
             "sphinx-rtd-theme>=1.0",
@@ -1,7 +1,20 @@
 from youtube_transcript import YouTubeTranscriptApi
-from transcript_list import TranscriptList
+from async_youtube_transcript import AsyncYouTubeTranscriptApi
+from transcript_list import TranscriptList, SelectionPlan
+from translation_languages import TranslationLanguages
+from transcript import Transcript
+from text_normalizer import TextNormalizer
 from fetched_transcript import FetchedTranscript
 from ai_translator import AITranscriptTranslator
+from transport import Transport, AsyncTransport
+from rate_limiter import AdaptiveRateLimiter, get_default_rate_limiter
+from retry import RetryPolicy, Deadline
+from proxy_pool import ProxyPool
+from caching import TranscriptCache, TrackListCache, NegativeResultCache
+from parsers import get_parser_backend, set_parser_backend
+from download_manifest import DownloadManifest
+from channel_sync import ChannelSyncState
+from channel_videos import iter_channel_video_ids, get_channel_video_ids
 from exceptions import (
     TranscriptRetrievalError,
     VideoUnavailable,
@@ -14,7 +27,9 @@ from exceptions import (
     CookiesInvalid,
     FailedToCreateConsentCookie,
     NoTranscriptAvailable,
-    TooManyRequests
+    TooManyRequests,
+    DeadlineExceeded,
+    ChannelUnavailable
 )
 from formatters import (
     Formatter,
@@ -38,8 +53,29 @@ __all__ = [
     
     # YouTube transcript API sınıfları
     'YouTubeTranscriptApi',
+    'AsyncYouTubeTranscriptApi',
     'TranscriptList',
+    'SelectionPlan',
+    'TranslationLanguages',
+    'Transcript',
+    'TextNormalizer',
     'FetchedTranscript',
+    'Transport',
+    'AsyncTransport',
+    'AdaptiveRateLimiter',
+    'get_default_rate_limiter',
+    'RetryPolicy',
+    'Deadline',
+    'ProxyPool',
+    'TranscriptCache',
+    'TrackListCache',
+    'NegativeResultCache',
+    'get_parser_backend',
+    'set_parser_backend',
+    'DownloadManifest',
+    'ChannelSyncState',
+    'iter_channel_video_ids',
+    'get_channel_video_ids',
     
     # Hata sınıfları
     'TranscriptRetrievalError',
@@ -54,6 +90,8 @@ __all__ = [
     'FailedToCreateConsentCookie',
     'NoTranscriptAvailable',
     'TooManyRequests',
+    'DeadlineExceeded',
+    'ChannelUnavailable',
     
     # Formatter sınıfları
     'Formatter',
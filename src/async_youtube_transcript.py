@@ -0,0 +1,766 @@
+import asyncio
+from collections import deque
+from typing import List, Dict, Optional, Union, Iterable, AsyncIterator
+
+from exceptions import (
+    TranscriptRetrievalError,
+    VideoUnavailable,
+    TranscriptNotFound,
+    TooManyRequests
+)
+from transcript_list import TranscriptList
+from fetched_transcript import FetchedTranscript
+from transport import AsyncTransport, aiohttp
+from rate_limiter import get_default_rate_limiter
+from retry import RetryPolicy, Deadline
+from caching import TranscriptCache, TrackListCache, NegativeResultCache
+from transcript import Transcript
+from youtube_transcript import YouTubeTranscriptApi
+
+
+class AsyncYouTubeTranscriptApi:
+    """
+    asyncio counterpart of YouTubeTranscriptApi.
+
+    All network access goes through an AsyncTransport and all backoff uses
+    asyncio.sleep, so a single event loop can keep many fetches in flight.
+    Track selection and parsing are shared with YouTubeTranscriptApi.
+    """
+
+    @classmethod
+    async def get_transcript(
+        cls,
+        video_id: str,
+        languages: List[str] = None,
+        proxies: Dict = None,
+        cookies: str = None,
+        preserve_formatting: bool = False,
+        transport: AsyncTransport = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        cache: TranscriptCache = None,
+        track_cache: TrackListCache = None,
+        negative_cache: NegativeResultCache = None,
+        compact: bool = False,
+        fmt: str = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> Union[List[Dict], Transcript]:
+        """
+        Retrieve transcript for a single video.
+
+        Args:
+            video_id: YouTube video ID
+            languages: List of language codes in order of preference
+            proxies: Proxy configuration for requests
+            cookies: Cookie string for authentication
+            preserve_formatting: Whether to preserve HTML formatting
+            transport: Shared async HTTP transport (a temporary one is used if omitted)
+            direct_innertube: Skip the watch page when an Innertube API key is cached
+            retry_policy: RetryPolicy used by every stage
+            timeout: End-to-end time budget in seconds for this video
+            cache: TranscriptCache answering repeat requests without any network access
+            track_cache: TrackListCache answering repeat listings without any network access
+            negative_cache: NegativeResultCache re-raising remembered "no transcript"
+                errors without any network access
+            compact: Whether to return a columnar Transcript instead of a list of dicts
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            allow_manual: Whether a manually created track may be used
+            allow_generated: Whether an auto-generated track may be used
+            allow_translation: Whether a track may be translated to a requested language
+
+        Returns:
+            List of transcript entries with 'text', 'start', and 'duration' keys,
+            or a Transcript if compact is set
+        """
+        if cache is not None:
+            cached = YouTubeTranscriptApi._find_cached_transcript(
+                cache,
+                video_id,
+                languages,
+                preserve_formatting,
+                allow_manual=allow_manual,
+                allow_generated=allow_generated,
+                allow_translation=allow_translation
+            )
+            if cached is not None:
+                return Transcript.from_list(cached) if compact else cached
+
+        if negative_cache is not None:
+            negative_cache.check(video_id, languages)
+
+        owns_transport = transport is None
+        if owns_transport:
+            transport = AsyncTransport(rate_limiter=get_default_rate_limiter())
+
+        deadline = Deadline(timeout) if timeout is not None else None
+
+        try:
+            transcript_list = await cls.list_transcripts(
+                video_id,
+                proxies=proxies,
+                cookies=cookies,
+                transport=transport,
+                direct_innertube=direct_innertube,
+                retry_policy=retry_policy,
+                deadline=deadline,
+                track_cache=track_cache
+            )
+            transcript = YouTubeTranscriptApi._select_transcript(
+                transcript_list,
+                languages,
+                allow_manual=allow_manual,
+                allow_generated=allow_generated,
+                allow_translation=allow_translation
+            )
+            if cache is not None:
+                cache.record_selection(
+                    video_id,
+                    TranscriptCache.selection_key(languages, allow_manual, allow_generated, allow_translation),
+                    transcript.language_code,
+                    transcript.cache_kind
+                )
+            return await cls.fetch(
+                transcript,
+                preserve_formatting=preserve_formatting,
+                transport=transport,
+                retry_policy=retry_policy,
+                deadline=deadline,
+                cache=cache,
+                compact=compact,
+                fmt=fmt
+            )
+        except TranscriptRetrievalError as e:
+            if negative_cache is not None and YouTubeTranscriptApi._is_negative_cacheable(
+                e, allow_manual, allow_generated, allow_translation
+            ):
+                negative_cache.record(e, languages)
+            raise
+        finally:
+            if owns_transport:
+                await transport.close()
+
+    @classmethod
+    async def get_transcripts(
+        cls,
+        video_ids: List[str],
+        languages: List[str] = None,
+        proxies: Dict = None,
+        cookies: str = None,
+        preserve_formatting: bool = False,
+        continue_on_failure: bool = False,
+        transport: AsyncTransport = None,
+        max_concurrency: int = 10,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        cache: TranscriptCache = None,
+        track_cache: TrackListCache = None,
+        negative_cache: NegativeResultCache = None,
+        compact: bool = False,
+        fmt: str = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> List[Dict]:
+        """
+        Retrieve transcripts for multiple videos concurrently.
+
+        Args:
+            video_ids: List of YouTube video IDs
+            languages: List of language codes in order of preference
+            proxies: Proxy configuration for requests
+            cookies: Cookie string for authentication
+            preserve_formatting: Whether to preserve HTML formatting
+            continue_on_failure: Whether to continue if a video fails
+            transport: Shared async HTTP transport reused for every video
+            max_concurrency: Maximum number of videos processed at the same time
+            direct_innertube: Skip the watch page when an Innertube API key is cached
+            retry_policy: RetryPolicy used by every stage of every video
+            timeout: End-to-end time budget in seconds for each video
+            cache: TranscriptCache shared by every video
+            track_cache: TrackListCache shared by every video
+            negative_cache: NegativeResultCache shared by every video
+            compact: Whether transcripts are columnar Transcript objects
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            allow_manual: Whether manually created tracks may be used
+            allow_generated: Whether auto-generated tracks may be used
+            allow_translation: Whether tracks may be translated to a requested language
+
+        Returns:
+            List of dictionaries with video_id and transcript data, in the
+            same order as video_ids
+        """
+        return [
+            record
+            async for record in cls.iter_transcripts(
+                video_ids,
+                languages=languages,
+                proxies=proxies,
+                cookies=cookies,
+                preserve_formatting=preserve_formatting,
+                continue_on_failure=continue_on_failure,
+                transport=transport,
+                max_concurrency=max_concurrency,
+                direct_innertube=direct_innertube,
+                retry_policy=retry_policy,
+                timeout=timeout,
+                cache=cache,
+                track_cache=track_cache,
+                negative_cache=negative_cache,
+                compact=compact,
+                fmt=fmt,
+                allow_manual=allow_manual,
+                allow_generated=allow_generated,
+                allow_translation=allow_translation
+            )
+        ]
+
+    @classmethod
+    async def iter_transcripts(
+        cls,
+        video_ids: Iterable[str],
+        languages: List[str] = None,
+        proxies: Dict = None,
+        cookies: str = None,
+        preserve_formatting: bool = False,
+        continue_on_failure: bool = True,
+        transport: AsyncTransport = None,
+        max_concurrency: int = 10,
+        ordered: bool = True,
+        max_in_flight: int = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        cache: TranscriptCache = None,
+        track_cache: TrackListCache = None,
+        negative_cache: NegativeResultCache = None,
+        compact: bool = False,
+        fmt: str = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> AsyncIterator[Dict]:
+        """
+        Retrieve transcripts for multiple videos, yielding each result as soon
+        as it is available; async counterpart of YouTubeTranscriptApi.iter_transcripts().
+
+        Args:
+            video_ids: Iterable of YouTube video IDs (may be a generator)
+            languages: List of language codes in order of preference
+            proxies: Proxy configuration for requests
+            cookies: Cookie string for authentication
+            preserve_formatting: Whether to preserve HTML formatting
+            continue_on_failure: Whether to yield failed videos with their error
+                instead of raising
+            transport: Shared async HTTP transport reused for every video
+            max_concurrency: Maximum number of videos processed at the same time
+            ordered: Whether to yield results in the order of video_ids;
+                False yields them in completion order
+            max_in_flight: Maximum number of videos started but not yet
+                yielded (defaults to twice max_concurrency)
+            direct_innertube: Skip the watch page when an Innertube API key is cached
+            retry_policy: RetryPolicy used by every stage of every video
+            timeout: End-to-end time budget in seconds for each video
+            cache: TranscriptCache shared by every video
+            track_cache: TrackListCache shared by every video
+            negative_cache: NegativeResultCache shared by every video
+            compact: Whether transcripts are columnar Transcript objects
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            allow_manual: Whether manually created tracks may be used
+            allow_generated: Whether auto-generated tracks may be used
+            allow_translation: Whether tracks may be translated to a requested language
+
+        Yields:
+            Dictionaries with video_id, transcript and error keys
+        """
+        owns_transport = transport is None
+        if owns_transport:
+            transport = AsyncTransport(rate_limiter=get_default_rate_limiter())
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        max_in_flight = max(max_in_flight or 2 * max_concurrency, 1)
+
+        async def fetch(video_id):
+            async with semaphore:
+                return await cls.get_transcript(
+                    video_id,
+                    languages=languages,
+                    proxies=proxies,
+                    cookies=cookies,
+                    preserve_formatting=preserve_formatting,
+                    transport=transport,
+                    direct_innertube=direct_innertube,
+                    retry_policy=retry_policy,
+                    timeout=timeout,
+                    cache=cache,
+                    track_cache=track_cache,
+                    negative_cache=negative_cache,
+                    compact=compact,
+                    fmt=fmt,
+                    allow_manual=allow_manual,
+                    allow_generated=allow_generated,
+                    allow_translation=allow_translation
+                )
+
+        pending = {}
+        start_order = deque()
+        video_id_iter = iter(video_ids)
+
+        def start_until_full():
+            while len(pending) < max_in_flight:
+                video_id = next(video_id_iter, None)
+                if video_id is None:
+                    return
+                task = asyncio.ensure_future(fetch(video_id))
+                pending[task] = video_id
+                start_order.append(task)
+
+        try:
+            start_until_full()
+            while pending:
+                if ordered:
+                    task = start_order.popleft()
+                    await asyncio.wait([task])
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(iter(done))
+                    start_order.remove(task)
+
+                video_id = pending.pop(task)
+                try:
+                    record = {
+                        'video_id': video_id,
+                        'transcript': task.result(),
+                        'error': None
+                    }
+                except Exception as e:
+                    if not continue_on_failure:
+                        raise
+                    record = {
+                        'video_id': video_id,
+                        'transcript': None,
+                        'error': str(e)
+                    }
+
+                start_until_full()
+                yield record
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if owns_transport:
+                await transport.close()
+
+    @classmethod
+    async def list_transcripts(
+        cls,
+        video_id: str,
+        proxies: Dict = None,
+        cookies: str = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        transport: AsyncTransport = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        deadline: Deadline = None,
+        track_cache: TrackListCache = None
+    ) -> TranscriptList:
+        """
+        List all available transcripts for a video.
+
+        Args:
+            video_id: YouTube video ID
+            proxies: Proxy configuration for requests
+            cookies: Cookie string for authentication
+            max_retries: Maximum number of retry attempts (ignored if retry_policy is given)
+            retry_delay: Delay between retries in seconds (ignored if retry_policy is given)
+            transport: Shared async HTTP transport (a temporary one is used if omitted)
+            direct_innertube: Call the Innertube player endpoint directly with the
+                cached API key and only download the watch page when needed
+            retry_policy: RetryPolicy deciding which failures are retried and when
+            deadline: End-to-end Deadline shared with the later timedtext fetch
+            track_cache: TrackListCache answering repeat listings of the same
+                video without any network access
+
+        Returns:
+            TranscriptList object containing all available transcripts. Its
+            transcripts are fetched with AsyncYouTubeTranscriptApi.fetch().
+        """
+        if track_cache is not None:
+            transcript_data = track_cache.get(video_id)
+            if transcript_data is not None:
+                return TranscriptList(video_id, transcript_data, proxies=proxies, cookies=cookies)
+
+        owns_transport = transport is None
+        if owns_transport:
+            transport = AsyncTransport(rate_limiter=get_default_rate_limiter())
+
+        retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
+        last_exception = None
+
+        try:
+            for attempt in range(retry_policy.max_retries + 1):
+                if deadline is not None:
+                    deadline.check(video_id)
+
+                response = None
+                try:
+                    if direct_innertube:
+                        transcript_data = await cls._fetch_transcript_data_direct(
+                            video_id,
+                            transport,
+                            proxies=proxies,
+                            deadline=deadline
+                        )
+                        if transcript_data:
+                            if track_cache is not None:
+                                track_cache.set(video_id, transcript_data)
+                            return TranscriptList(video_id, transcript_data, proxies=proxies, cookies=cookies)
+
+                    watch_url = YouTubeTranscriptApi._WATCH_URL.format(video_id=video_id)
+
+                    response = await transport.get(
+                        watch_url,
+                        headers=YouTubeTranscriptApi._WATCH_HEADERS,
+                        proxies=proxies,
+                        cookies=cookies,
+                        timeout=deadline.request_timeout(30) if deadline else 30
+                    )
+
+                    if response.status_code == 404:
+                        raise VideoUnavailable(video_id)
+                    elif response.status_code != 200:
+                        # Only a 404 means the video is gone; other statuses (403, 5xx, ...)
+                        # may be transient and must not end up in a NegativeResultCache
+                        if response.status_code == 429:
+                            last_exception = TooManyRequests(video_id)
+                        else:
+                            last_exception = TranscriptRetrievalError(video_id, f"HTTP {response.status_code}")
+                        if not retry_policy.is_retryable_status(response.status_code):
+                            raise last_exception
+                    else:
+                        transcript_data = await cls._extract_transcript_data(
+                            response.text,
+                            video_id,
+                            transport=transport,
+                            proxies=proxies,
+                            deadline=deadline
+                        )
+
+                        if transcript_data:
+                            if track_cache is not None:
+                                track_cache.set(video_id, transcript_data)
+                            return TranscriptList(video_id, transcript_data, proxies=proxies, cookies=cookies)
+
+                        last_exception = TranscriptNotFound(video_id)
+                        response = None
+
+                except TranscriptRetrievalError:
+                    raise
+                except asyncio.TimeoutError as e:
+                    last_exception = TranscriptRetrievalError(video_id, f"Request timeout: {str(e)}")
+                except aiohttp.ClientConnectionError as e:
+                    last_exception = TranscriptRetrievalError(video_id, f"Connection error: {str(e)}")
+                except Exception as e:
+                    last_exception = TranscriptRetrievalError(video_id, f"Failed to retrieve transcript list: {str(e)}")
+
+                delay = retry_policy.next_delay(attempt, response, deadline)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            if owns_transport:
+                await transport.close()
+
+        if deadline is not None:
+            deadline.check(video_id)
+
+        # If all retries failed, raise the last exception
+        raise last_exception or TranscriptRetrievalError(video_id, "Failed to retrieve transcript list after all retries")
+
+    @classmethod
+    async def fetch(
+        cls,
+        transcript: FetchedTranscript,
+        preserve_formatting: bool = False,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        transport: AsyncTransport = None,
+        retry_policy: RetryPolicy = None,
+        deadline: Deadline = None,
+        cache: TranscriptCache = None,
+        compact: bool = False,
+        fmt: str = None,
+        keep_raw: bool = True
+    ) -> Union[List[Dict], Transcript]:
+        """
+        Fetch the data of a transcript; async counterpart of FetchedTranscript.fetch().
+
+        Parsed segments are memoized on the transcript just like there.
+
+        Args:
+            transcript: FetchedTranscript returned by a TranscriptList
+            preserve_formatting: Whether to preserve HTML formatting in text
+            max_retries: Maximum number of retry attempts (ignored if retry_policy is given)
+            retry_delay: Delay between retries in seconds (ignored if retry_policy is given)
+            transport: Shared async HTTP transport (a temporary one is used if omitted)
+            retry_policy: RetryPolicy deciding which failures are retried and when
+            deadline: End-to-end Deadline of the video this fetch belongs to
+            cache: TranscriptCache consulted before and filled after the download
+            compact: Whether to return a columnar Transcript instead of a list of dicts
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            keep_raw: Whether to keep the raw response after parsing so the other
+                preserve_formatting variant can be parsed without downloading
+
+        Returns:
+            List of transcript entries with 'text', 'start', and 'duration' keys,
+            or a Transcript if compact is set
+
+        Raises:
+            ValueError: If fmt is not one of FetchedTranscript.FORMATS
+        """
+        url = transcript._create_format_url(fmt) if fmt else transcript.url
+
+        memoized = transcript._memoized(preserve_formatting, compact, keep_raw)
+        if memoized is not None:
+            return memoized
+
+        if cache is not None:
+            cached = cache.get(transcript.video_id, transcript.language_code, transcript.cache_kind, preserve_formatting)
+            if cached is not None:
+                return transcript._memoize(preserve_formatting, Transcript.from_list(cached), compact)
+
+        owns_transport = transport is None
+        if owns_transport:
+            transport = AsyncTransport(rate_limiter=get_default_rate_limiter())
+
+        retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
+        video_id = transcript.video_id
+        language_code = transcript.language_code
+        last_exception = None
+
+        try:
+            for attempt in range(retry_policy.max_retries + 1):
+                if deadline is not None:
+                    deadline.check(video_id)
+
+                response = None
+                try:
+                    response = await transport.get(
+                        url,
+                        proxies=transcript._proxies,
+                        cookies=transcript._cookies,
+                        timeout=deadline.request_timeout(30) if deadline else 30
+                    )
+
+                    if response.status_code == 200:
+                        raw_data = response.text
+                        segments = transcript._process_transcript_data(raw_data, preserve_formatting, compact=True)
+                        if keep_raw:
+                            transcript._fetched_data = raw_data
+                        if cache is not None:
+                            cache.set(video_id, language_code, transcript.cache_kind, preserve_formatting, segments)
+                        return transcript._memoize(preserve_formatting, segments, compact)
+
+                    if response.status_code == 429:
+                        last_exception = TooManyRequests(video_id)
+                    else:
+                        last_exception = TranscriptRetrievalError(
+                            video_id,
+                            f"Failed to fetch transcript: HTTP {response.status_code}"
+                        )
+                    if not retry_policy.is_retryable_status(response.status_code):
+                        raise last_exception
+
+                except TranscriptRetrievalError:
+                    raise
+                except asyncio.TimeoutError as e:
+                    last_exception = TranscriptRetrievalError(
+                        video_id,
+                        f"Request timeout for language {language_code}: {str(e)}"
+                    )
+                except aiohttp.ClientConnectionError as e:
+                    last_exception = TranscriptRetrievalError(
+                        video_id,
+                        f"Connection error for language {language_code}: {str(e)}"
+                    )
+                except Exception as e:
+                    last_exception = TranscriptRetrievalError(
+                        video_id,
+                        f"Failed to fetch transcript for language {language_code}: {str(e)}"
+                    )
+
+                delay = retry_policy.next_delay(attempt, response, deadline)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            if owns_transport:
+                await transport.close()
+
+        if deadline is not None:
+            deadline.check(video_id)
+
+        # If all retries failed, raise the last exception
+        raise last_exception or TranscriptRetrievalError(
+            video_id,
+            f"Failed to fetch transcript for language {language_code} after all retries"
+        )
+
+    @classmethod
+    async def _extract_transcript_data(
+        cls,
+        html_content: str,
+        video_id: str,
+        transport: AsyncTransport,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ) -> Dict:
+        """
+        Extract transcript data from YouTube video page HTML.
+
+        Args:
+            html_content: HTML content of the video page
+            video_id: YouTube video ID
+            transport: Async HTTP transport used for the Innertube request
+            proxies: Proxy configuration for requests
+            deadline: Deadline capping the Innertube request timeout
+
+        Returns:
+            Dictionary containing transcript data
+        """
+        # First, try to use Innertube API
+        try:
+            api_key = YouTubeTranscriptApi._extract_innertube_api_key(html_content)
+            if api_key:
+                YouTubeTranscriptApi._innertube_key_cache.set(api_key)
+                innertube_data = await cls._fetch_innertube_data(
+                    video_id,
+                    api_key,
+                    transport,
+                    proxies=proxies,
+                    deadline=deadline
+                )
+                if innertube_data:
+                    captions_data = YouTubeTranscriptApi._extract_captions_from_innertube(innertube_data)
+                    if captions_data:
+                        return YouTubeTranscriptApi._parse_transcript_data(captions_data, video_id)
+        except Exception:
+            pass  # Fallback to HTML parsing
+
+        return YouTubeTranscriptApi._extract_transcript_data_from_html(html_content, video_id)
+
+    @classmethod
+    async def _fetch_transcript_data_direct(
+        cls,
+        video_id: str,
+        transport: AsyncTransport,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ) -> Optional[Dict]:
+        """
+        Fetch transcript data from the Innertube player endpoint with the cached API key.
+
+        Args:
+            video_id: YouTube video ID
+            transport: Async HTTP transport to send the request with
+            proxies: Proxy configuration for requests
+            deadline: Deadline capping the request timeout
+
+        Returns:
+            Dictionary containing transcript data, or None if the watch page is needed
+        """
+        key_cache = YouTubeTranscriptApi._innertube_key_cache
+        api_key = key_cache.get()
+        if not api_key:
+            return None
+
+        response = await cls._post_innertube_player(
+            video_id,
+            api_key,
+            transport,
+            proxies=proxies,
+            deadline=deadline
+        )
+        if response is None or response.status_code != 200:
+            # Only a rejected key is dropped; transport failures and 429s keep it
+            if response is not None and response.status_code in YouTubeTranscriptApi._REJECTED_KEY_STATUSES:
+                key_cache.invalidate(api_key)
+            return None
+
+        try:
+            innertube_data = response.json()
+        except ValueError:
+            return None
+
+        captions_data = YouTubeTranscriptApi._extract_captions_from_innertube(innertube_data)
+        if captions_data:
+            return YouTubeTranscriptApi._parse_transcript_data(captions_data, video_id)
+        return None
+
+    @classmethod
+    async def _fetch_innertube_data(
+        cls,
+        video_id: str,
+        api_key: str,
+        transport: AsyncTransport,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ) -> Optional[Dict]:
+        """
+        Fetch transcript data from YouTube Innertube API.
+
+        Args:
+            video_id: YouTube video ID
+            api_key: Innertube API key
+            transport: Async HTTP transport to send the request with
+            proxies: Proxy configuration for requests
+            deadline: Deadline capping the request timeout
+
+        Returns:
+            Innertube response data or None if failed
+        """
+        response = await cls._post_innertube_player(
+            video_id,
+            api_key,
+            transport,
+            proxies=proxies,
+            deadline=deadline
+        )
+        try:
+            if response is not None and response.status_code == 200:
+                return response.json()
+        except Exception:
+            pass
+
+        return None
+
+    @classmethod
+    async def _post_innertube_player(
+        cls,
+        video_id: str,
+        api_key: str,
+        transport: AsyncTransport,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ):
+        """
+        Send the Innertube player request.
+
+        Returns:
+            The response, or None if the request itself failed (timeout,
+            connection error)
+        """
+        try:
+            return await transport.post(
+                YouTubeTranscriptApi._INNERTUBE_PLAYER_URL.format(api_key=api_key),
+                headers=YouTubeTranscriptApi._INNERTUBE_HEADERS,
+                json=YouTubeTranscriptApi._innertube_player_payload(video_id),
+                proxies=proxies,
+                timeout=deadline.request_timeout(30) if deadline else None
+            )
+        except Exception:
+            return None
@@ -0,0 +1,666 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import List, Dict, Optional, Union
+
+from exceptions import (
+    TranscriptRetrievalError,
+    VideoUnavailable,
+    TranscriptNotFound,
+    NoTranscriptFound
+)
+from transcript import Transcript
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'u-transkript')
+
+
+class TranscriptCache:
+    """
+    Persistent SQLite cache of parsed transcripts.
+
+    Entries are keyed by (video_id, language_code, kind, preserve_formatting),
+    where kind is 'manual', 'generated' or, for a translation, 'translated'
+    followed by the kind and language of its source track (see
+    FetchedTranscript.cache_kind), and store the parsed segments. Alongside,
+    the transcript each request (languages and type filters) selected is
+    remembered, so a repeated request is answered without listing tracks. Entries older than ttl are ignored. A running total of the
+    stored size is kept, so a write only touches its own row until the
+    total exceeds max_bytes; then expired entries are purged and the least
+    recently used ones evicted.
+
+    One TranscriptCache can be shared by threads and processes: SQLite
+    serialises writers on the database file.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: float = 7 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        Initialize TranscriptCache.
+
+        Args:
+            path: SQLite database file (defaults to ~/.cache/u-transkript/transcripts.sqlite3,
+                ':memory:' keeps the cache in memory)
+            ttl: Seconds an entry stays valid
+            max_bytes: Total size of stored segments before LRU eviction starts
+        """
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, 'transcripts.sqlite3')
+
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS transcripts ('
+            ' video_id TEXT NOT NULL,'
+            ' language_code TEXT NOT NULL,'
+            ' kind TEXT NOT NULL,'
+            ' preserve_formatting INTEGER NOT NULL,'
+            ' segments TEXT NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL,'
+            ' PRIMARY KEY (video_id, language_code, kind, preserve_formatting))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS transcripts_accessed_at ON transcripts (accessed_at)')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS selections ('
+            ' video_id TEXT NOT NULL,'
+            ' selection TEXT NOT NULL,'
+            ' language_code TEXT NOT NULL,'
+            ' kind TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' PRIMARY KEY (video_id, selection))'
+        )
+        # Running total of the stored segments; an estimate when other
+        # processes write too, recounted by _evict()
+        self._bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM transcripts').fetchone()[0]
+
+    def get(
+        self,
+        video_id: str,
+        language_code: str,
+        kind: str,
+        preserve_formatting: bool = False
+    ) -> Optional[List[Dict]]:
+        """
+        Return cached segments, or None on a miss or an expired entry.
+
+        Args:
+            video_id: YouTube video ID
+            language_code: Language code of the transcript
+            kind: FetchedTranscript.cache_kind of the transcript
+            preserve_formatting: Whether the segments kept HTML formatting
+        """
+        now = time.time()
+        key = (video_id, language_code, kind, int(preserve_formatting))
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT segments, created_at FROM transcripts'
+                ' WHERE video_id = ? AND language_code = ? AND kind = ? AND preserve_formatting = ?',
+                key
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                self._misses += 1
+                return None
+
+            self._conn.execute(
+                'UPDATE transcripts SET accessed_at = ?'
+                ' WHERE video_id = ? AND language_code = ? AND kind = ? AND preserve_formatting = ?',
+                (now,) + key
+            )
+            self._hits += 1
+        return json.loads(row[0])
+
+    @staticmethod
+    def selection_key(
+        languages: List[str] = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> str:
+        """
+        Key of a transcript request: its language preference list and type filters.
+        """
+        filters = ''.join(
+            flag for flag, allowed in (('m', allow_manual), ('g', allow_generated), ('t', allow_translation))
+            if allowed
+        )
+        return f"{','.join(languages) if languages else '*'}|{filters}"
+
+    def record_selection(self, video_id: str, selection: str, language_code: str, kind: str):
+        """
+        Remember which transcript a request selected, so find_selected() can
+        answer the same request before its tracks are listed.
+
+        Args:
+            video_id: YouTube video ID
+            selection: selection_key() of the request
+            language_code: Language code of the selected transcript
+            kind: FetchedTranscript.cache_kind of the selected transcript
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO selections VALUES (?, ?, ?, ?, ?)',
+                (video_id, selection, language_code, kind, time.time())
+            )
+
+    def find_selected(
+        self,
+        video_id: str,
+        selection: str,
+        preserve_formatting: bool = False
+    ) -> Optional[List[Dict]]:
+        """
+        Return the cached transcript a request selected before, if both the
+        selection and the transcript are still valid.
+
+        Only hits are counted: a miss here is followed by the get() of the
+        transcript eventually selected, which counts it.
+
+        Args:
+            video_id: YouTube video ID
+            selection: selection_key() of the request
+            preserve_formatting: Whether the segments kept HTML formatting
+
+        Returns:
+            Cached segments, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT t.language_code, t.kind, t.segments, t.created_at, s.created_at'
+                ' FROM selections s JOIN transcripts t'
+                ' ON t.video_id = s.video_id AND t.language_code = s.language_code AND t.kind = s.kind'
+                ' WHERE s.video_id = ? AND s.selection = ? AND t.preserve_formatting = ?',
+                (video_id, selection, int(preserve_formatting))
+            ).fetchone()
+
+            if row is None or now - row[3] > self.ttl or now - row[4] > self.ttl:
+                return None
+
+            self._conn.execute(
+                'UPDATE transcripts SET accessed_at = ?'
+                ' WHERE video_id = ? AND language_code = ? AND kind = ? AND preserve_formatting = ?',
+                (now, video_id, row[0], row[1], int(preserve_formatting))
+            )
+            self._hits += 1
+        return json.loads(row[2])
+
+    def set(
+        self,
+        video_id: str,
+        language_code: str,
+        kind: str,
+        preserve_formatting: bool,
+        segments: Union[List[Dict], Transcript]
+    ):
+        """
+        Store parsed segments and evict least recently used entries if the
+        cache has grown past max_bytes.
+        """
+        if isinstance(segments, Transcript):
+            segments = segments.to_list()
+        payload = json.dumps(segments, ensure_ascii=False, separators=(',', ':'))
+        size = len(payload.encode('utf-8'))
+        now = time.time()
+        key = (video_id, language_code, kind, int(preserve_formatting))
+        with self._lock:
+            replaced = self._conn.execute(
+                'SELECT size FROM transcripts'
+                ' WHERE video_id = ? AND language_code = ? AND kind = ? AND preserve_formatting = ?',
+                key
+            ).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                key + (payload, size, now, now)
+            )
+            self._bytes += size - (replaced[0] if replaced else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """
+        Drop expired entries, recount the stored size, then drop least
+        recently used entries until under max_bytes.
+        """
+        expired = time.time() - self.ttl
+        self._conn.execute('DELETE FROM transcripts WHERE created_at < ?', (expired,))
+        self._conn.execute('DELETE FROM selections WHERE created_at < ?', (expired,))
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM transcripts').fetchone()[0]
+        self._bytes = total
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            'SELECT rowid, size FROM transcripts ORDER BY accessed_at'
+        ).fetchall()
+        doomed = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((rowid,))
+            total -= size
+        self._conn.executemany('DELETE FROM transcripts WHERE rowid = ?', doomed)
+        self._evictions += len(doomed)
+        self._bytes = total
+
+    def invalidate(self, video_id: str):
+        """
+        Drop every cached transcript of a video.
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM transcripts WHERE video_id = ?',
+                (video_id,)
+            ).fetchone()[0]
+            self._conn.execute('DELETE FROM transcripts WHERE video_id = ?', (video_id,))
+            self._conn.execute('DELETE FROM selections WHERE video_id = ?', (video_id,))
+            self._bytes = max(self._bytes - removed, 0)
+
+    def clear(self):
+        """
+        Drop every cached transcript.
+        """
+        with self._lock:
+            self._conn.execute('DELETE FROM transcripts')
+            self._conn.execute('DELETE FROM selections')
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters for monitoring.
+
+        Returns:
+            Dictionary with hits, misses, evictions, entries and bytes
+        """
+        with self._lock:
+            entries, total = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transcripts'
+            ).fetchone()
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'entries': entries,
+                'bytes': total
+            }
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f"TranscriptCache(path='{self.path}', ttl={self.ttl}, max_bytes={self.max_bytes})"
+
+
+class TrackListCache:
+    """
+    Bounded LRU cache of parsed caption-track metadata, optionally backed by SQLite.
+
+    Stores the transcript_data dictionaries produced by
+    YouTubeTranscriptApi._parse_transcript_data, so repeated list_transcripts
+    calls for a video skip the watch page and Innertube requests. Track URLs
+    are signed and carry an 'expire' timestamp; an entry is dropped
+    expiry_margin seconds before its earliest URL expires, or after ttl,
+    whichever comes first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 3600,
+        path: str = None,
+        expiry_margin: float = 300
+    ):
+        """
+        Initialize TrackListCache.
+
+        Args:
+            maxsize: Maximum number of videos kept in memory
+            ttl: Seconds an entry stays valid at most
+            path: Optional SQLite database file that persists entries across runs
+            expiry_margin: Seconds before the signed URLs expire at which an
+                entry is no longer served
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self.expiry_margin = expiry_margin
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS track_lists ('
+                ' video_id TEXT PRIMARY KEY,'
+                ' transcript_data TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL)'
+            )
+
+    def _expires_at(self, transcript_data: Dict, now: float) -> float:
+        """
+        Wall-clock time after which transcript_data must not be served.
+        """
+        expires_at = now + self.ttl
+        for transcripts in transcript_data.values():
+            for transcript_info in transcripts:
+                query = urllib.parse.urlsplit(transcript_info.get('url', '')).query
+                expire = urllib.parse.parse_qs(query).get('expire')
+                if expire:
+                    try:
+                        expires_at = min(expires_at, float(expire[0]) - self.expiry_margin)
+                    except ValueError:
+                        continue
+        return expires_at
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        Return the cached transcript_data of a video, or None on a miss or an
+        expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    'SELECT transcript_data, expires_at FROM track_lists WHERE video_id = ?',
+                    (video_id,)
+                ).fetchone()
+                if row is not None:
+                    entry = (json.loads(row[0]), row[1])
+                    self._store(video_id, entry)
+
+            if entry is None or now >= entry[1]:
+                if entry is not None:
+                    self._remove(video_id)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(video_id)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, video_id: str, transcript_data: Dict):
+        """
+        Store the parsed transcript_data of a video.
+        """
+        expires_at = self._expires_at(transcript_data, time.time())
+        with self._lock:
+            self._store(video_id, (transcript_data, expires_at))
+            if self._conn is not None:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO track_lists VALUES (?, ?, ?)',
+                    (video_id, json.dumps(transcript_data, ensure_ascii=False, separators=(',', ':')), expires_at)
+                )
+
+    def _store(self, video_id: str, entry: tuple):
+        self._entries[video_id] = entry
+        self._entries.move_to_end(video_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _remove(self, video_id: str):
+        self._entries.pop(video_id, None)
+        if self._conn is not None:
+            self._conn.execute('DELETE FROM track_lists WHERE video_id = ?', (video_id,))
+
+    def invalidate(self, video_id: str):
+        """
+        Drop the cached track list of a video.
+        """
+        with self._lock:
+            self._remove(video_id)
+
+    def clear(self):
+        """
+        Drop every cached track list.
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM track_lists')
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters for monitoring.
+
+        Returns:
+            Dictionary with hits, misses and entries (kept in memory)
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'entries': len(self._entries)
+            }
+
+    def close(self):
+        """
+        Close the database connection, if any.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"TrackListCache(maxsize={self.maxsize}, ttl={self.ttl}, path={self.path!r})"
+
+
+class NegativeResultCache:
+    """
+    Cache of videos known to have no usable transcript.
+
+    Remembers VideoUnavailable, TranscriptNotFound and NoTranscriptFound
+    results, each for its own TTL, so sweeps that revisit caption-less
+    videos raise the remembered error immediately instead of
+    repeating the watch page requests and the full retry loop.
+    NoTranscriptFound depends on the requested languages and is remembered
+    per language list; the other errors apply to the whole video.
+    """
+
+    DEFAULT_TTLS = {
+        VideoUnavailable: 24 * 3600,
+        TranscriptNotFound: 6 * 3600,
+        NoTranscriptFound: 6 * 3600
+    }
+
+    def __init__(self, ttls: Dict = None, path: str = None, maxsize: int = 100000):
+        """
+        Initialize NegativeResultCache.
+
+        Args:
+            ttls: Seconds each exception class is remembered, merged over
+                DEFAULT_TTLS (a TTL of 0 disables caching that class)
+            path: Optional SQLite database file that persists entries across runs
+            maxsize: Maximum number of entries kept in memory
+        """
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.path = path
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS negative_results ('
+                ' video_id TEXT NOT NULL,'
+                ' languages TEXT NOT NULL,'
+                ' error TEXT NOT NULL,'
+                ' message TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL,'
+                ' PRIMARY KEY (video_id, languages))'
+            )
+
+    @staticmethod
+    def _languages_key(languages: List[str] = None) -> str:
+        return ','.join(languages) if languages else '*'
+
+    def _lookup(self, key: tuple, now: float) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is None and self._conn is not None:
+            row = self._conn.execute(
+                'SELECT error, message, expires_at FROM negative_results WHERE video_id = ? AND languages = ?',
+                key
+            ).fetchone()
+            if row is not None:
+                entry = tuple(row)
+                self._store(key, entry)
+
+        if entry is not None and now >= entry[2]:
+            self._remove(key)
+            return None
+        return entry
+
+    def check(self, video_id: str, languages: List[str] = None):
+        """
+        Raise the remembered error of a video, if one is cached.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Requested language codes
+
+        Raises:
+            TranscriptRetrievalError: The remembered VideoUnavailable,
+                TranscriptNotFound or NoTranscriptFound
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._lookup((video_id, ''), now) or self._lookup((video_id, self._languages_key(languages)), now)
+            if entry is None:
+                self._misses += 1
+                return
+            self._hits += 1
+        raise self._rebuild_error(video_id, entry[0], entry[1], languages)
+
+    def record(self, error: TranscriptRetrievalError, languages: List[str] = None):
+        """
+        Remember error if its class is cached; other errors are ignored.
+
+        Args:
+            error: Exception raised while retrieving a transcript
+            languages: Language codes that were requested
+        """
+        ttl = next((ttl for cls, ttl in self.ttls.items() if type(error) is cls), 0)
+        if ttl <= 0:
+            return
+
+        languages_key = self._languages_key(languages) if isinstance(error, NoTranscriptFound) else ''
+        key = (error.video_id, languages_key)
+        entry = (type(error).__name__, str(error), time.time() + ttl)
+        with self._lock:
+            self._store(key, entry)
+            if self._conn is not None:
+                self._conn.execute('INSERT OR REPLACE INTO negative_results VALUES (?, ?, ?, ?, ?)', key + entry)
+
+    def _rebuild_error(self, video_id: str, error_name: str, message: str, languages: List[str] = None):
+        """
+        Recreate a remembered exception with its original message.
+        """
+        error_class = next(
+            (cls for cls in self.ttls if cls.__name__ == error_name),
+            TranscriptRetrievalError
+        )
+        error = error_class.__new__(error_class)
+        TranscriptRetrievalError.__init__(error, video_id, message)
+        if isinstance(error, NoTranscriptFound):
+            error.requested_language_codes = languages
+            error.transcript_data = {}
+        return error
+
+    def _store(self, key: tuple, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _remove(self, key: tuple):
+        self._entries.pop(key, None)
+        if self._conn is not None:
+            self._conn.execute('DELETE FROM negative_results WHERE video_id = ? AND languages = ?', key)
+
+    def invalidate(self, video_id: str):
+        """
+        Forget every remembered error of a video.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == video_id]:
+                del self._entries[key]
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM negative_results WHERE video_id = ?', (video_id,))
+
+    def clear(self):
+        """
+        Forget every remembered error.
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM negative_results')
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters for monitoring.
+
+        Returns:
+            Dictionary with hits, misses and entries (kept in memory)
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'entries': len(self._entries)
+            }
+
+    def close(self):
+        """
+        Close the database connection, if any.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __repr__(self):
+        return f"NegativeResultCache(entries={len(self._entries)}, path={self.path!r})"
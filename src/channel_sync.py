@@ -0,0 +1,231 @@
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class ChannelSyncState:
+    """
+    Per-channel record of the videos already synced, for incremental runs.
+
+    For every video listed on the channel it keeps when it was first and
+    last seen, and the outcome of its latest download: status, kind of the
+    track used, SHA-256 of the saved transcript and when it was checked.
+    pending() then picks only what a new run has to fetch: videos never
+    downloaded, failures whose retry delay has passed and, optionally,
+    recently published videos with an auto-generated track, whose text
+    may still change. A video counts as recent by its publish time when
+    the caller knows it, else by when a sync first saw it; videos recorded
+    by the first sync of a channel (its back catalogue) are never recent.
+
+    The state is one JSON file, written atomically by save().
+    """
+
+    FILENAME = 'sync_state.json'
+
+    # Consecutive already-known videos after which a listing is read no further
+    KNOWN_RUN = 10
+
+    def __init__(self, path: str, channel: str = None):
+        """
+        Initialize ChannelSyncState, loading the state already in path.
+
+        Args:
+            path: JSON file of the state (created by save() if missing)
+            channel: Channel the state belongs to, stored for reference
+        """
+        self.path = path
+        self.channel = channel
+        self.last_synced_at = None
+        self._videos = {}
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.channel = channel or state.get('channel')
+            self.last_synced_at = state.get('last_synced_at')
+            self._videos = state.get('videos', {})
+
+    @classmethod
+    def for_directory(cls, output_dir: str, channel: str = None) -> 'ChannelSyncState':
+        """
+        Open the sync state of an output directory.
+        """
+        return cls(os.path.join(output_dir, cls.FILENAME), channel=channel)
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        State of a video, or None if it was never seen.
+        """
+        return self._videos.get(video_id)
+
+    def collect(self, video_ids: Iterable[str], min_count: int, known_run: int = None) -> List[str]:
+        """
+        Read a lazy channel listing, newest first, as far as a sync needs it.
+
+        The first sync of a channel (nothing known yet) reads min_count
+        videos. Later syncs read at least min_count videos and then keep
+        reading until known_run consecutive videos (or every known video, if
+        fewer are known) are already known, so no upload is missed however
+        many arrived since the previous sync.
+
+        Args:
+            video_ids: Iterable of the channel's video IDs, newest first
+            min_count: Number of videos read at least (at most on a first sync)
+            known_run: Consecutive known videos that end the listing
+                (defaults to KNOWN_RUN)
+
+        Returns:
+            Video IDs read, in listing order
+        """
+        known_run = min(known_run or self.KNOWN_RUN, len(self._videos))
+        collected = []
+        run = 0
+        for video_id in video_ids:
+            collected.append(video_id)
+            run = run + 1 if video_id in self._videos else 0
+            if len(collected) >= min_count and run >= known_run:
+                break
+        return collected
+
+    def seed(self, entries: Iterable[Dict]):
+        """
+        Adopt successful downloads made before the first sync, e.g. the
+        entries of an existing DownloadManifest, as the back catalogue.
+
+        Videos the state already knows are left unchanged.
+
+        Args:
+            entries: Entries as recorded by DownloadManifest.record_success()
+        """
+        for entry in entries:
+            if entry.get('status') != 'success' or entry['video_id'] in self._videos:
+                continue
+            seen_at = entry.get('finished_at') or time.time()
+            self._videos[entry['video_id']] = {
+                'first_seen': seen_at,
+                'last_seen': seen_at,
+                'status': 'success',
+                'backfill': True,
+                'checked_at': seen_at,
+                'file': entry['file'],
+                'sha256': entry['sha256'],
+                'language_code': entry.get('language_code'),
+                'kind': entry.get('kind')
+            }
+
+    def pending(
+        self,
+        video_ids: List[str],
+        recheck_generated: float = 0,
+        retry_failed_after: float = 6 * 3600,
+        now: float = None
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Split a channel listing into the videos a sync has to fetch.
+
+        Args:
+            video_ids: Video IDs currently listed on the channel
+            recheck_generated: Seconds after being published (or first seen)
+                during which a video synced from an auto-generated track is
+                fetched again (0 disables re-checks)
+            retry_failed_after: Seconds after a failed attempt before the
+                video is tried again
+
+        Returns:
+            Tuple of (new, recheck): videos without a successful download
+            that are due, and downloaded videos due for a re-check, both in
+            listing order
+        """
+        now = time.time() if now is None else now
+        new, recheck = [], []
+        for video_id in video_ids:
+            video = self._videos.get(video_id)
+            if video is None or video.get('status') is None:
+                new.append(video_id)
+            elif video['status'] != 'success':
+                if now - (video.get('checked_at') or 0) >= retry_failed_after:
+                    new.append(video_id)
+            elif recheck_generated > 0 and video.get('kind') == 'generated':
+                published_at = video.get('published_at')
+                if published_at is None and not video.get('backfill'):
+                    published_at = video['first_seen']
+                if published_at is not None and now - published_at < recheck_generated:
+                    recheck.append(video_id)
+        return new, recheck
+
+    def mark_seen(self, video_ids: List[str], published_at: Dict[str, float] = None, now: float = None):
+        """
+        Record that videos are listed on the channel.
+
+        Videos seen before the state was first saved are marked as backfill.
+
+        Args:
+            video_ids: Video IDs currently listed on the channel
+            published_at: Optional publish timestamps by video ID
+        """
+        now = time.time() if now is None else now
+        backfill = self.last_synced_at is None
+        for video_id in video_ids:
+            video = self._videos.get(video_id)
+            if video is None:
+                video = self._videos[video_id] = {'first_seen': now, 'status': None, 'backfill': backfill}
+            video['last_seen'] = now
+            if published_at and video_id in published_at:
+                video['published_at'] = published_at[video_id]
+
+    def record(self, entry: Dict) -> bool:
+        """
+        Record the outcome of a download, as returned by
+        DownloadManifest.record_success() or record_failure().
+
+        A failed re-check keeps the transcript synced before.
+
+        Returns:
+            Whether a previously synced transcript changed
+        """
+        now = time.time()
+        video = self._videos.setdefault(entry['video_id'], {
+            'first_seen': now,
+            'last_seen': now,
+            'status': None,
+            'backfill': self.last_synced_at is None
+        })
+        video['checked_at'] = entry.get('finished_at', now)
+        if entry['status'] != 'success':
+            if video.get('status') != 'success':
+                video['status'] = entry['status']
+            return False
+
+        changed = video.get('sha256') is not None and video['sha256'] != entry['sha256']
+        video.update(
+            status='success',
+            file=entry['file'],
+            sha256=entry['sha256'],
+            language_code=entry['language_code'],
+            kind=entry['kind']
+        )
+        return changed
+
+    def save(self):
+        """
+        Write the state to its file atomically.
+        """
+        self.last_synced_at = time.time()
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {'channel': self.channel, 'last_synced_at': self.last_synced_at, 'videos': self._videos},
+                f,
+                ensure_ascii=False
+            )
+        os.replace(temp_path, self.path)
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self._videos
+
+    def __len__(self):
+        return len(self._videos)
+
+    def __repr__(self):
+        return f"ChannelSyncState(channel={self.channel!r}, videos={len(self._videos)})"
@@ -0,0 +1,255 @@
+import re
+import requests
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from exceptions import ChannelUnavailable
+from json_extractor import extract_json_object
+from retry import RetryPolicy
+from transport import Transport, get_default_transport
+
+
+_BROWSE_URL = 'https://www.youtube.com/youtubei/v1/browse?prettyPrint=false'
+_PAGE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Upgrade-Insecure-Requests': '1',
+}
+_BROWSE_HEADERS = {'Content-Type': 'application/json'}
+_DEFAULT_CLIENT_VERSION = '2.20231201.01.00'
+
+_API_KEY_RE = re.compile(r'"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"')
+_CLIENT_VERSION_RE = re.compile(r'"INNERTUBE_CLIENT_VERSION":\s*"([0-9.]+)"')
+_VISITOR_DATA_RE = re.compile(r'"VISITOR_DATA":\s*"([^"]+)"')
+
+# Renderers of one video in a channel tab, mapped to their video ID key
+_VIDEO_RENDERERS = {
+    'videoRenderer': 'videoId',
+    'gridVideoRenderer': 'videoId',
+    'reelItemRenderer': 'videoId'
+}
+
+
+def build_channel_videos_url(channel: str) -> str:
+    """
+    Build the URL of a channel's videos tab.
+
+    Args:
+        channel: Channel handle (with or without @), UC... channel ID or URL
+
+    Returns:
+        YouTube channel videos URL
+    """
+    channel = channel.strip()
+
+    # If it's already a full URL, return as is
+    if channel.startswith('http'):
+        return channel
+
+    if channel.startswith('UC') and len(channel) == 24:
+        return f"https://www.youtube.com/channel/{channel}/videos"
+
+    if channel.startswith('@'):
+        channel = channel[1:]
+
+    return f"https://www.youtube.com/@{channel}/videos"
+
+
+def iter_channel_video_ids(
+    channel: str,
+    max_count: int = None,
+    transport: Transport = None,
+    proxies: Dict = None,
+    cookies: str = None,
+    retry_policy: RetryPolicy = None
+) -> Iterator[str]:
+    """
+    Yield the video IDs of a channel lazily, newest upload first.
+
+    The videos tab is downloaded once and its ytInitialData read for the
+    first page of videos; later pages are requested from the Innertube
+    browse endpoint with the continuation token of the page before, only
+    when the consumer asks for more IDs.
+
+    Args:
+        channel: Channel handle (with or without @), UC... channel ID or URL
+        max_count: Maximum number of video IDs to yield (None for all)
+        transport: Shared HTTP transport (defaults to the process-wide one)
+        proxies: Proxy configuration for requests
+        cookies: Cookie string for authentication
+        retry_policy: RetryPolicy for every page request
+
+    Yields:
+        Video IDs, without duplicates
+
+    Raises:
+        ChannelUnavailable: If the channel page or a continuation cannot be
+            retrieved, or the page carries no video list
+    """
+    transport = transport or get_default_transport()
+    retry_policy = retry_policy or RetryPolicy()
+
+    response = _request(
+        channel,
+        transport,
+        retry_policy,
+        'GET',
+        build_channel_videos_url(channel),
+        headers=_PAGE_HEADERS,
+        proxies=proxies,
+        cookies=cookies
+    )
+    html_content = response.text
+    initial_data = extract_json_object(html_content, 'ytInitialData')
+    if initial_data is None:
+        raise ChannelUnavailable(channel, "no ytInitialData on the channel page")
+
+    browse_url = _BROWSE_URL
+    api_key = _API_KEY_RE.search(html_content)
+    if api_key:
+        browse_url = f"{browse_url}&key={api_key.group(1)}"
+
+    client_version = _CLIENT_VERSION_RE.search(html_content)
+    client = {
+        'clientName': 'WEB',
+        'clientVersion': client_version.group(1) if client_version else _DEFAULT_CLIENT_VERSION,
+        'hl': 'en'
+    }
+    visitor_data = _VISITOR_DATA_RE.search(html_content)
+    if visitor_data:
+        client['visitorData'] = visitor_data.group(1)
+
+    video_ids, token = _parse_items(_selected_tab_content(initial_data))
+    seen = set()
+
+    while True:
+        for video_id in video_ids:
+            if video_id in seen:
+                continue
+            if max_count is not None and len(seen) >= max_count:
+                return
+            seen.add(video_id)
+            yield video_id
+
+        if not token or (max_count is not None and len(seen) >= max_count):
+            return
+
+        response = _request(
+            channel,
+            transport,
+            retry_policy,
+            'POST',
+            browse_url,
+            headers=_BROWSE_HEADERS,
+            json={'context': {'client': client}, 'continuation': token},
+            proxies=proxies,
+            cookies=cookies
+        )
+        try:
+            data = response.json()
+        except ValueError:
+            raise ChannelUnavailable(channel, "invalid browse continuation response")
+        video_ids, token = _parse_items(data.get('onResponseReceivedActions', []))
+
+
+def get_channel_video_ids(channel: str, max_count: int = 10, **kwargs) -> List[str]:
+    """
+    List the latest video IDs of a channel, newest first.
+
+    Args:
+        channel: Channel handle (with or without @), UC... channel ID or URL
+        max_count: Maximum number of video IDs to return
+        **kwargs: Passed through to iter_channel_video_ids
+
+    Returns:
+        List of video IDs
+
+    Raises:
+        ChannelUnavailable: If the video list cannot be retrieved
+    """
+    return list(iter_channel_video_ids(channel, max_count=max_count, **kwargs))
+
+
+def _request(
+    channel: str,
+    transport: Transport,
+    retry_policy: RetryPolicy,
+    method: str,
+    url: str,
+    **kwargs
+) -> requests.Response:
+    """
+    Send a page request, retrying what retry_policy allows.
+    """
+    last_exception = None
+
+    for attempt in range(retry_policy.max_retries + 1):
+        response = None
+        try:
+            response = transport.request(method, url, **kwargs)
+            if response.status_code == 200:
+                return response
+            last_exception = ChannelUnavailable(channel, f"HTTP {response.status_code} from {url}")
+            if not retry_policy.is_retryable_status(response.status_code):
+                raise last_exception
+        except ChannelUnavailable:
+            raise
+        except requests.exceptions.RequestException as e:
+            last_exception = ChannelUnavailable(channel, str(e))
+
+        if not retry_policy.sleep(attempt, response):
+            break
+
+    raise last_exception
+
+
+def _selected_tab_content(initial_data: Dict) -> Dict:
+    """
+    Content of the selected tab of a channel page, so the videos listed in
+    the header or other tabs are not picked up.
+    """
+    tabs = initial_data.get('contents', {}).get('twoColumnBrowseResultsRenderer', {}).get('tabs', [])
+    for tab in tabs:
+        renderer = tab.get('tabRenderer') or tab.get('expandableTabRenderer') or {}
+        if renderer.get('selected'):
+            return renderer.get('content', {})
+    return initial_data.get('contents', {})
+
+
+def _parse_items(node) -> Tuple[List[str], Optional[str]]:
+    """
+    Collect the video IDs, in page order, and the continuation token of a
+    page of channel items.
+    """
+    video_ids = []
+    tokens = []
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        children = []
+        for key, value in node.items():
+            if key in _VIDEO_RENDERERS and isinstance(value, dict):
+                video_id = value.get(_VIDEO_RENDERERS[key])
+                if video_id:
+                    video_ids.append(video_id)
+            elif key == 'lockupViewModel' and isinstance(value, dict):
+                if value.get('contentType') == 'LOCKUP_CONTENT_TYPE_VIDEO' and value.get('contentId'):
+                    video_ids.append(value['contentId'])
+            elif key == 'continuationItemRenderer' and isinstance(value, dict):
+                token = (
+                    value.get('continuationEndpoint', {})
+                    .get('continuationCommand', {})
+                    .get('token')
+                )
+                if token:
+                    tokens.append(token)
+            elif isinstance(value, (dict, list)):
+                children.append(value)
+        stack.extend(reversed(children))
+
+    return video_ids, tokens[-1] if tokens else None
@@ -0,0 +1,205 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+
+class DownloadManifest:
+    """
+    Append-only JSONL checkpoint of a batch download.
+
+    The manifest lives in the output directory and holds one line per
+    finished video: its status ('success' or 'failed'), the saved file and
+    the SHA-256 of its content, the language and kind of the track used,
+    the error of a failure and the time the attempt took. Every line is
+    flushed as soon as it is written, so an interrupted run loses nothing
+    it had finished. When a video appears more than once, its last line
+    wins; superseded lines are dropped when the manifest is opened.
+
+    One DownloadManifest can be shared by threads.
+    """
+
+    FILENAME = 'manifest.jsonl'
+
+    def __init__(self, path: str):
+        """
+        Initialize DownloadManifest, loading the entries already in path.
+
+        Args:
+            path: JSONL file of the manifest (created if missing)
+        """
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        lines = 0
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line torn by an interrupted write
+                        continue
+                    if isinstance(entry, dict) and entry.get('video_id'):
+                        self._entries.pop(entry['video_id'], None)
+                        self._entries[entry['video_id']] = entry
+
+        if lines > len(self._entries):
+            self._rewrite()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @classmethod
+    def for_directory(cls, output_dir: str) -> 'DownloadManifest':
+        """
+        Open the manifest of an output directory.
+        """
+        return cls(os.path.join(output_dir, cls.FILENAME))
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        SHA-256 hex digest of a saved transcript.
+        """
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _rewrite(self):
+        """
+        Replace the file with the current entries, one line per video.
+        """
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.path)
+
+    def _append(self, entry: Dict):
+        with self._lock:
+            self._entries.pop(entry['video_id'], None)
+            self._entries[entry['video_id']] = entry
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        Latest entry of a video, or None if it was never attempted.
+        """
+        return self._entries.get(video_id)
+
+    def is_complete(self, video_id: str) -> bool:
+        """
+        Whether a video was downloaded successfully and its file still
+        exists next to the manifest.
+        """
+        entry = self._entries.get(video_id)
+        if entry is None or entry.get('status') != 'success':
+            return False
+        return os.path.exists(os.path.join(os.path.dirname(self.path), entry['file']))
+
+    def record_success(
+        self,
+        video_id: str,
+        filename: str,
+        content: str,
+        language_code: str = None,
+        kind: str = None,
+        elapsed: float = None
+    ) -> Dict:
+        """
+        Record a saved transcript.
+
+        Args:
+            video_id: YouTube video ID
+            filename: File name of the transcript, relative to the manifest
+            content: Saved transcript text, hashed into the entry
+            language_code: Language code of the track used
+            kind: 'manual', 'generated' or 'translated'
+            elapsed: Seconds the download took
+
+        Returns:
+            The recorded entry
+        """
+        entry = {
+            'video_id': video_id,
+            'status': 'success',
+            'file': filename,
+            'sha256': self.content_hash(content),
+            'language_code': language_code,
+            'kind': kind,
+            'error': None,
+            'finished_at': time.time(),
+            'elapsed': elapsed
+        }
+        self._append(entry)
+        return entry
+
+    def record_failure(self, video_id: str, error: str, elapsed: float = None) -> Dict:
+        """
+        Record a failed download; a previously saved file is kept listed.
+
+        Args:
+            video_id: YouTube video ID
+            error: Error message
+            elapsed: Seconds the attempt took
+
+        Returns:
+            The recorded entry
+        """
+        previous = self._entries.get(video_id) or {}
+        entry = {
+            'video_id': video_id,
+            'status': 'failed',
+            'file': previous.get('file'),
+            'sha256': previous.get('sha256'),
+            'language_code': previous.get('language_code'),
+            'kind': previous.get('kind'),
+            'error': error,
+            'finished_at': time.time(),
+            'elapsed': elapsed
+        }
+        self._append(entry)
+        return entry
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Entry counters.
+
+        Returns:
+            Dictionary with entries, succeeded and failed
+        """
+        with self._lock:
+            succeeded = sum(1 for entry in self._entries.values() if entry.get('status') == 'success')
+            return {
+                'entries': len(self._entries),
+                'succeeded': succeeded,
+                'failed': len(self._entries) - succeeded
+            }
+
+    def close(self):
+        """
+        Close the manifest file.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(list(self._entries.values()))
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"DownloadManifest(path={self.path!r}, entries={len(self._entries)})"
@@ -48,7 +48,11 @@ class NoTranscriptFound(TranscriptRetrievalError):
     def __init__(self, video_id, requested_language_codes, transcript_data):
         self.requested_language_codes = requested_language_codes
         self.transcript_data = transcript_data
-        available_languages = [t['language_code'] for t in transcript_data]
+        if isinstance(transcript_data, dict):
+            # TranscriptList passes its transcript_data keyed by language code
+            available_languages = list(transcript_data)
+        else:
+            available_languages = [t['language_code'] for t in transcript_data]
         super().__init__(
             video_id,
             f"No transcript found for video {video_id} in requested languages: {requested_language_codes}. "
@@ -131,3 +135,27 @@ class TooManyRequests(TranscriptRetrievalError):
             video_id,
             "Too many requests. Your IP may be temporarily blocked. Please try again later."
         )
+
+
+class DeadlineExceeded(TranscriptRetrievalError):
+    """
+    Raised when the end-to-end time budget for a video runs out.
+    """
+    def __init__(self, video_id, timeout):
+        self.timeout = timeout
+        super().__init__(
+            video_id,
+            f"Deadline of {timeout}s exceeded while retrieving transcript for video {video_id}"
+        )
+
+
+class ChannelUnavailable(TranscriptRetrievalError):
+    """
+    Raised when the video list of a channel cannot be retrieved.
+    """
+    def __init__(self, channel, reason=None):
+        self.channel = channel
+        message = f"Could not list the videos of channel {channel}"
+        if reason:
+            message = f"{message}: {reason}"
+        super().__init__(None, message)
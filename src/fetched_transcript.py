@@ -1,11 +1,6 @@
-import re
-import html
-import json
 import requests
-import time
 import urllib.parse
-from typing import List, Dict, Optional
-from xml.etree import ElementTree
+from typing import List, Dict, Optional, Union, Iterator, Tuple
 
 from exceptions import (
     TranscriptRetrievalError,
@@ -13,12 +8,29 @@ from exceptions import (
     TranslationLanguageNotAvailable,
     TooManyRequests
 )
+from transport import Transport, get_default_transport
+from retry import RetryPolicy, Deadline
+from caching import TranscriptCache
+from transcript import Transcript
+from parsers import get_parser_backend, load_json
+from text_normalizer import TextNormalizer
+from translation_languages import TranslationLanguages
 
 
 class FetchedTranscript:
     """
     Represents a single transcript that can be fetched and formatted.
     """
+
+    _STREAM_CHUNK_SIZE = 64 * 1024
+    # timedtext formats that can be requested and parsed: srv1 (<text start dur>
+    # in seconds), srv3 (<p t d> in milliseconds) and json3 (events with segs)
+    FORMATS = ('srv1', 'srv3', 'json3')
+    # Segment text clean-up, keyed by preserve_formatting
+    _NORMALIZERS = {
+        False: TextNormalizer(),
+        True: TextNormalizer(strip_tags=False, unescape=False)
+    }
     
     def __init__(
         self,
@@ -28,9 +40,12 @@ class FetchedTranscript:
         url: str,
         is_generated: bool,
         is_translatable: bool,
-        translation_languages: List[Dict[str, str]],
+        translation_languages: Union[List[Dict[str, str]], TranslationLanguages],
         proxies: Dict = None,
-        cookies: str = None
+        cookies: str = None,
+        transport: Transport = None,
+        source_language_code: str = None,
+        source_kind: str = None
     ):
         """
         Initialize FetchedTranscript.
@@ -42,9 +57,13 @@ class FetchedTranscript:
             url: URL to fetch transcript data
             is_generated: Whether this is an auto-generated transcript
             is_translatable: Whether this transcript can be translated
-            translation_languages: List of available translation languages
+            translation_languages: Available translation languages (stored as a
+                shared TranslationLanguages table)
             proxies: Proxy configuration for requests
             cookies: Cookie string for authentication
+            transport: Shared HTTP transport (defaults to the process-wide one)
+            source_language_code: Language of the track translated, for translations
+            source_kind: Kind of the track translated, for translations
         """
         self.video_id = video_id
         self.language_code = language_code
@@ -52,86 +71,165 @@ class FetchedTranscript:
         self.url = url
         self.is_generated = is_generated
         self.is_translatable = is_translatable
-        self.translation_languages = translation_languages
+        self.translation_languages = TranslationLanguages.of(translation_languages)
         self._proxies = proxies
         self._cookies = cookies
+        self._transport = transport
+        self.source_language_code = source_language_code
+        self.source_kind = source_kind
         self._fetched_data = None
+        # Parsed segments per preserve_formatting value, kept compact
+        self._parsed = {}
+
+    @property
+    def kind(self) -> str:
+        """
+        Transcript kind: 'manual', 'generated' or 'translated'.
+        """
+        if 'tlang=' in self.url:
+            return 'translated'
+        return 'generated' if self.is_generated else 'manual'
+
+    @property
+    def cache_kind(self) -> str:
+        """
+        Kind used as TranscriptCache key. Translations also name their source
+        track (e.g. 'translated:manual:en'), since translating another track
+        gives another text.
+        """
+        kind = self.kind
+        if kind == 'translated' and self.source_language_code:
+            return f"{kind}:{self.source_kind}:{self.source_language_code}"
+        return kind
 
-    def fetch(self, preserve_formatting: bool = False, max_retries: int = 3, retry_delay: float = 1.0) -> List[Dict]:
+    def fetch(
+        self,
+        preserve_formatting: bool = False,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        retry_policy: RetryPolicy = None,
+        deadline: Deadline = None,
+        cache: TranscriptCache = None,
+        compact: bool = False,
+        stream: bool = False,
+        fmt: str = None,
+        keep_raw: bool = True
+    ) -> Union[List[Dict], Transcript]:
         """
         Fetch the transcript data.
 
+        The parsed segments are memoized per preserve_formatting value, so
+        repeated calls (e.g. one per output format) neither download nor
+        parse again.
+
         Args:
             preserve_formatting: Whether to preserve HTML formatting in text
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            max_retries: Maximum number of retry attempts (ignored if retry_policy is given)
+            retry_delay: Delay between retries in seconds (ignored if retry_policy is given)
+            retry_policy: RetryPolicy deciding which failures are retried and when
+            deadline: End-to-end Deadline of the video this fetch belongs to
+            cache: TranscriptCache consulted before and filled after the download
+            compact: Whether to return a columnar Transcript instead of a list of dicts
+            stream: Whether to parse the response incrementally while it downloads;
+                the raw data is then not kept, so fetching the other
+                preserve_formatting variant later downloads it again
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3');
+                by default the format of the track URL is used
+            keep_raw: Whether to keep the raw response after parsing so the other
+                preserve_formatting variant can be parsed without downloading;
+                False frees it and keeps only the parsed segments
 
         Returns:
-            List of transcript entries with 'text', 'start', and 'duration' keys
+            List of transcript entries with 'text', 'start', and 'duration' keys,
+            or a Transcript if compact is set
+
+        Raises:
+            ValueError: If fmt is not one of FORMATS
         """
-        if self._fetched_data is not None:
-            return self._process_transcript_data(self._fetched_data, preserve_formatting)
+        url = self._create_format_url(fmt) if fmt else self.url
+
+        memoized = self._memoized(preserve_formatting, compact, keep_raw)
+        if memoized is not None:
+            return memoized
 
+        if cache is not None:
+            cached = cache.get(self.video_id, self.language_code, self.cache_kind, preserve_formatting)
+            if cached is not None:
+                return self._memoize(preserve_formatting, Transcript.from_list(cached), compact)
+
+        transport = self._transport or get_default_transport()
+        retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
         last_exception = None
 
-        for attempt in range(max_retries + 1):
-            try:
-                session = requests.Session()
-                if self._proxies:
-                    session.proxies.update(self._proxies)
+        for attempt in range(retry_policy.max_retries + 1):
+            if deadline is not None:
+                deadline.check(self.video_id)
 
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
+            response = None
+            try:
+                response = transport.get(
+                    url,
+                    proxies=self._proxies,
+                    cookies=self._cookies,
+                    timeout=deadline.request_timeout(30) if deadline else 30,
+                    stream=stream
+                )
 
-                if self._cookies:
-                    headers['Cookie'] = self._cookies
+                if response.status_code == 200:
+                    if stream:
+                        try:
+                            segments = self._process_transcript_stream(
+                                response.iter_content(chunk_size=self._STREAM_CHUNK_SIZE),
+                                preserve_formatting,
+                                compact=True
+                            )
+                        finally:
+                            response.close()
+                    else:
+                        raw_data = response.text
+                        segments = self._process_transcript_data(raw_data, preserve_formatting, compact=True)
+                        if keep_raw:
+                            self._fetched_data = raw_data
+                    if cache is not None:
+                        cache.set(self.video_id, self.language_code, self.cache_kind, preserve_formatting, segments)
+                    return self._memoize(preserve_formatting, segments, compact)
 
-                response = session.get(self.url, headers=headers, timeout=30)
+                if stream:
+                    response.close()
 
                 if response.status_code == 429:
-                    if attempt < max_retries:
-                        time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                        continue
-                    raise TooManyRequests(self.video_id)
-                elif response.status_code != 200:
-                    if attempt < max_retries:
-                        time.sleep(retry_delay)
-                        continue
-                    raise TranscriptRetrievalError(
+                    last_exception = TooManyRequests(self.video_id)
+                else:
+                    last_exception = TranscriptRetrievalError(
                         self.video_id,
                         f"Failed to fetch transcript: HTTP {response.status_code}"
                     )
+                if not retry_policy.is_retryable_status(response.status_code):
+                    raise last_exception
 
-                self._fetched_data = response.text
-                return self._process_transcript_data(self._fetched_data, preserve_formatting)
-
-            except TooManyRequests:
+            except TranscriptRetrievalError:
                 raise
             except requests.exceptions.Timeout as e:
                 last_exception = TranscriptRetrievalError(
                     self.video_id,
                     f"Request timeout for language {self.language_code}: {str(e)}"
                 )
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
             except requests.exceptions.ConnectionError as e:
                 last_exception = TranscriptRetrievalError(
                     self.video_id,
                     f"Connection error for language {self.language_code}: {str(e)}"
                 )
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
             except Exception as e:
                 last_exception = TranscriptRetrievalError(
                     self.video_id,
                     f"Failed to fetch transcript for language {self.language_code}: {str(e)}"
                 )
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
+
+            if not retry_policy.sleep(attempt, response, deadline):
+                break
+
+        if deadline is not None:
+            deadline.check(self.video_id)
 
         # If all retries failed, raise the last exception
         raise last_exception or TranscriptRetrievalError(
@@ -139,107 +237,215 @@ class FetchedTranscript:
             f"Failed to fetch transcript for language {self.language_code} after all retries"
         )
 
-    def _process_transcript_data(self, xml_data: str, preserve_formatting: bool = False) -> List[Dict]:
+    def _memoized(
+        self,
+        preserve_formatting: bool,
+        compact: bool,
+        keep_raw: bool = True
+    ) -> Optional[Union[List[Dict], Transcript]]:
+        """
+        Return the memoized segments for preserve_formatting, parsing the
+        kept raw response if only that is available; None if neither is.
+        """
+        segments = self._parsed.get(preserve_formatting)
+        if segments is None:
+            if self._fetched_data is None:
+                return None
+            segments = self._process_transcript_data(self._fetched_data, preserve_formatting, compact=True)
+            self._parsed[preserve_formatting] = segments
+        if not keep_raw:
+            self._fetched_data = None
+        return segments if compact else segments.to_list()
+
+    def _memoize(
+        self,
+        preserve_formatting: bool,
+        segments: Transcript,
+        compact: bool
+    ) -> Union[List[Dict], Transcript]:
+        """
+        Memoize parsed segments and return them in the requested shape.
+
+        The compact Transcript has no mutating methods and is shared between
+        calls; list callers get a fresh list each time.
+        """
+        self._parsed[preserve_formatting] = segments
+        return segments if compact else segments.to_list()
+
+    def _process_transcript_data(
+        self,
+        xml_data: str,
+        preserve_formatting: bool = False,
+        compact: bool = False
+    ) -> Union[List[Dict], Transcript]:
         """
         Process XML transcript data into structured format.
         
         Args:
             xml_data: Raw XML transcript data
             preserve_formatting: Whether to preserve HTML formatting
+            compact: Whether to return a columnar Transcript instead of a list of dicts
             
         Returns:
-            List of transcript entries
+            List of transcript entries, or a Transcript if compact is set
+        """
+        try:
+            segments = self._iter_segments(xml_data, preserve_formatting)
+            if compact:
+                return Transcript(segments)
+            return [
+                {'text': text, 'start': start, 'duration': duration}
+                for text, start, duration in segments
+            ]
+        except Exception:
+            # Veri parse edilemezse boş transkript olarak kabul et
+            return Transcript() if compact else []
+
+    def _iter_segments(self, xml_data: str, preserve_formatting: bool = False) -> Iterator[Tuple[str, float, float]]:
+        """
+        Parse transcript data into (text, start, duration) tuples.
+
+        Args:
+            xml_data: Raw srv1/srv3 XML or json3 transcript data
+            preserve_formatting: Whether to preserve HTML formatting
+
+        Returns:
+            Iterator over the non-empty, normalized segments; empty if the
+            data is empty or can be parsed neither as XML nor as JSON
         """
         if not xml_data or not xml_data.strip():
-            # Gelen veri boşsa, boş liste döndür veya uygun bir hata fırlat.
-            # Bu durumda, genellikle bu video için bir transkript olmadığı anlamına gelir.
-            # Loglama eklenebilir: print(f"Warning: Empty transcript data received for video {self.video_id}, lang {self.language_code}")
-            return [] # Boş transkript olarak kabul et
+            # Gelen veri boşsa, genellikle bu video için bir transkript olmadığı anlamına gelir.
+            return iter(())
 
-        try:
-            # Parse XML data
-            root = ElementTree.fromstring(xml_data)
-            transcript_entries = []
-            
-            for text_element in root.findall('.//text'):
-                # Extract timing information
-                start = float(text_element.get('start', 0))
-                duration = float(text_element.get('dur', 0))
-                
-                # Extract text content
-                text_content = text_element.text or ''
-                
-                # Process text formatting
-                if not preserve_formatting:
-                    # Remove HTML tags and decode HTML entities
-                    text_content = re.sub(r'<[^>]+>', '', text_content)
-                    text_content = html.unescape(text_content)
-                
-                # Clean up whitespace
-                text_content = text_content.strip()
-                
-                if text_content:  # Only include non-empty entries
-                    transcript_entries.append({
-                        'text': text_content,
-                        'start': start,
-                        'duration': duration
-                    })
-                    
-            return transcript_entries
-            
-        except ElementTree.ParseError as e_xml:
-            # If XML parsing fails, try to handle as JSON (some formats)
+        # json3 is recognised up front instead of after a failed XML parse
+        if xml_data[:64].lstrip().startswith('{'):
+            raw_segments = self._iter_json_data(xml_data)
+        else:
+            backend = get_parser_backend()
             try:
-                data = json.loads(xml_data)
-                return self._process_json_transcript_data(data, preserve_formatting)
-            except json.JSONDecodeError as e_json:
-                # Hem XML hem de JSON parse edilemezse, bu durumu logla ve boş liste döndür
-                # veya daha spesifik bir hata fırlat.
-                # print(f"Warning: Could not parse transcript data as XML or JSON for video {self.video_id}, lang {self.language_code}. XML Error: {e_xml}, JSON Error: {e_json}. Data: {xml_data[:200]}...")
-                # Hata fırlatmak yerine boş liste döndürmek, AI çevirmeninin boş metinle başa çıkmasını sağlar.
-                # raise TranscriptRetrievalError(
-                #     self.video_id,
-                #     f"Failed to parse transcript data as XML or JSON. XML: {e_xml}, JSON: {e_json}"
-                # )
-                return [] # Parse edilemeyen veriyi boş transkript olarak kabul et
-            except Exception as e_general_json: # json.loads bilinmeyen bir hata verirse
-                # print(f"Warning: General error parsing transcript data as JSON for video {self.video_id}, lang {self.language_code}. Error: {e_general_json}. Data: {xml_data[:200]}...")
-                return []
-        except Exception as e_general_xml: # ElementTree.fromstring bilinmeyen bir hata verirse
-            # print(f"Warning: General error parsing transcript data as XML for video {self.video_id}, lang {self.language_code}. Error: {e_general_xml}. Data: {xml_data[:200]}...")
-            return []
-
-    def _process_json_transcript_data(self, json_data: Dict, preserve_formatting: bool = False) -> List[Dict]:
-        """
-        Process JSON transcript data (alternative format).
-        """
-        transcript_entries = []
-        
-        # Handle different JSON structures that YouTube might use
-        events = json_data.get('events', [])
-        
-        for event in events:
-            if 'segs' in event:
-                start_time = event.get('tStartMs', 0) / 1000.0
-                text_segments = event['segs']
-                
-                combined_text = ''
-                for segment in text_segments:
-                    if 'utf8' in segment:
-                        combined_text += segment['utf8']
-                
-                if combined_text.strip():
-                    if not preserve_formatting:
-                        combined_text = re.sub(r'<[^>]+>', '', combined_text)
-                        combined_text = html.unescape(combined_text)
-                    
-                    transcript_entries.append({
-                        'text': combined_text.strip(),
-                        'start': start_time,
-                        'duration': event.get('dDurationMs', 0) / 1000.0
-                    })
-                    
-        return transcript_entries
+                root = backend.fromstring(xml_data)
+            except backend.parse_errors:
+                # If XML parsing fails, try to handle as JSON (some formats)
+                raw_segments = self._iter_json_data(xml_data)
+            else:
+                raw_segments = self._iter_xml_segments(root)
+
+        return self._NORMALIZERS[preserve_formatting].normalize_segments(raw_segments)
+
+    def _iter_json_data(self, json_text: str) -> Iterator[Tuple[str, float, float]]:
+        """
+        Decode json3 transcript data into raw (text, start, duration) tuples;
+        empty if it is not a JSON object.
+        """
+        try:
+            data = load_json(json_text)
+        except ValueError:
+            return iter(())
+        if not isinstance(data, dict):
+            return iter(())
+        return self._iter_json_segments(data)
+
+    def _iter_xml_segments(self, root) -> Iterator[Tuple[str, float, float]]:
+        """
+        Yield raw (text, start, duration) tuples from a parsed srv1 or srv3 document.
+        """
+        # srv3 documents have a <timedtext> root with <p> cues
+        tag = 'p' if root.tag == 'timedtext' else 'text'
+        for text_element in root.iter(tag):
+            yield self._element_segment(text_element)
+
+    def _element_segment(self, text_element) -> Tuple[str, float, float]:
+        """
+        Convert one srv1 <text> or srv3 <p> element into a raw (text, start,
+        duration) tuple; the text is normalized afterwards in batches.
+        """
+        if text_element.tag == 'p':
+            # srv3: times in milliseconds, words of ASR cues in <s> children
+            return (
+                ''.join(text_element.itertext()),
+                float(text_element.get('t', 0)) / 1000.0,
+                float(text_element.get('d', 0)) / 1000.0
+            )
+        return (
+            text_element.text or '',
+            float(text_element.get('start', 0)),
+            float(text_element.get('dur', 0))
+        )
+
+    def _process_transcript_stream(
+        self,
+        chunks: Iterator[bytes],
+        preserve_formatting: bool = False,
+        compact: bool = False
+    ) -> Union[List[Dict], Transcript]:
+        """
+        Parse a timedtext response incrementally while it is being downloaded.
+
+        The raw bytes are fed to the parser backend's pull parser chunk by
+        chunk, so parsing overlaps with the download and neither the decoded
+        body nor the full element tree is ever held in memory: every <text>
+        element is detached from its parent once its segment has been
+        emitted. srv1 and srv3 bodies are both handled. If the body turns out
+        not to be XML (json3), the buffered bytes are parsed the regular way.
+
+        Network errors raised while reading chunks propagate to the caller.
+
+        Args:
+            chunks: Iterator over the raw response body
+            preserve_formatting: Whether to preserve HTML formatting
+            compact: Whether to return a columnar Transcript instead of a list of dicts
+
+        Returns:
+            List of transcript entries, or a Transcript if compact is set
+        """
+        backend = get_parser_backend()
+        # Raw bytes are kept only until the first element proves the body is XML
+        head = []
+
+        def recorded_chunks():
+            for chunk in chunks:
+                if head is not None:
+                    head.append(chunk)
+                yield chunk
+
+        def raw_segments():
+            nonlocal head
+            for element in backend.pull_elements(recorded_chunks(), tags=('text', 'p')):
+                head = None
+                yield self._element_segment(element)
+
+        def segments():
+            return self._NORMALIZERS[preserve_formatting].normalize_segments(raw_segments())
+
+        try:
+            if compact:
+                return Transcript(segments())
+            return [
+                {'text': text, 'start': start, 'duration': duration}
+                for text, start, duration in segments()
+            ]
+        except backend.parse_errors + (ValueError,):
+            if head is None:
+                # Broken XML after valid segments: treat like an unparseable body
+                return Transcript() if compact else []
+            body = b''.join(head) + b''.join(chunks)
+            return self._process_transcript_data(body.decode('utf-8', errors='replace'), preserve_formatting, compact)
+
+    def _iter_json_segments(self, json_data: Dict) -> Iterator[Tuple[str, float, float]]:
+        """
+        Yield raw (text, start, duration) tuples from json3 transcript data.
+        """
+        for event in json_data.get('events', ()):
+            text_segments = event.get('segs')
+            if not text_segments:
+                continue
+
+            # One join per event instead of concatenating segment by segment
+            yield (
+                ''.join([segment.get('utf8', '') for segment in text_segments]),
+                event.get('tStartMs', 0) / 1000.0,
+                event.get('dDurationMs', 0) / 1000.0
+            )
 
     def translate(self, target_language_code: str) -> 'FetchedTranscript':
         """
@@ -258,27 +464,13 @@ class FetchedTranscript:
         if not self.is_translatable:
             raise NotTranslatable(self.video_id, self.language_code)
             
-        # Check if target language is available
-        available_languages = [lang['language_code'] for lang in self.translation_languages]
-        if target_language_code not in available_languages:
-            raise TranslationLanguageNotAvailable(
-                self.video_id,
-                target_language_code,
-                available_languages
-            )
-            
-        # Find target language info
-        target_language_info = None
-        for lang in self.translation_languages:
-            if lang['language_code'] == target_language_code:
-                target_language_info = lang
-                break
-                
-        if not target_language_info:
+        # Look the target language up in the shared table's index
+        target_language = self.translation_languages.get_name(target_language_code)
+        if target_language is None:
             raise TranslationLanguageNotAvailable(
                 self.video_id,
                 target_language_code,
-                available_languages
+                self.translation_languages.codes()
             )
             
         # Create translated URL
@@ -287,15 +479,39 @@ class FetchedTranscript:
         return FetchedTranscript(
             video_id=self.video_id,
             language_code=target_language_code,
-            language=target_language_info['language'],
+            language=target_language,
             url=translated_url,
             is_generated=True,  # Translations are always generated
             is_translatable=False,  # Translations cannot be further translated
-            translation_languages=[],
+            translation_languages=(),
             proxies=self._proxies,
-            cookies=self._cookies
+            cookies=self._cookies,
+            transport=self._transport,
+            source_language_code=self.language_code,
+            source_kind=self.kind
         )
 
+    def _create_format_url(self, fmt: str) -> str:
+        """
+        Create URL requesting the transcript in another timedtext format.
+
+        Args:
+            fmt: One of FORMATS
+
+        Returns:
+            URL for fetching the transcript in that format
+
+        Raises:
+            ValueError: If fmt is not one of FORMATS
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown timedtext format: {fmt}. Available: {list(self.FORMATS)}")
+
+        parsed_url = urllib.parse.urlparse(self.url)
+        query_params = urllib.parse.parse_qs(parsed_url.query)
+        query_params['fmt'] = [fmt]
+        return urllib.parse.urlunparse(parsed_url._replace(query=urllib.parse.urlencode(query_params, doseq=True)))
+
     def _create_translated_url(self, target_language_code: str) -> str:
         """
         Create URL for translated transcript.
@@ -1,8 +1,10 @@
 import json
 import html
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from abc import ABC, abstractmethod
 
+from transcript import Transcript, iter_segment_tuples
+
 
 class Formatter(ABC):
     """
@@ -10,12 +12,12 @@ class Formatter(ABC):
     """
     
     @abstractmethod
-    def format_transcript(self, transcript: List[Dict], **kwargs) -> str:
+    def format_transcript(self, transcript: Union[List[Dict], Transcript], **kwargs) -> str:
         """
         Format transcript data.
         
         Args:
-            transcript: List of transcript entries
+            transcript: List of transcript entries or a Transcript
             **kwargs: Additional formatting options
             
         Returns:
@@ -29,12 +31,12 @@ class PrettyPrintFormatter(Formatter):
     Formatter for human-readable output.
     """
     
-    def format_transcript(self, transcript: List[Dict], **kwargs) -> str:
+    def format_transcript(self, transcript: Union[List[Dict], Transcript], **kwargs) -> str:
         """
         Format transcript for pretty printing.
         
         Args:
-            transcript: List of transcript entries
+            transcript: List of transcript entries or a Transcript
             **kwargs: Additional options (show_timestamps, max_chars_per_line)
             
         Returns:
@@ -45,11 +47,7 @@ class PrettyPrintFormatter(Formatter):
         
         formatted_lines = []
         
-        for entry in transcript:
-            text = entry['text']
-            start = entry['start']
-            duration = entry['duration']
-            
+        for text, start, duration in iter_segment_tuples(transcript):
             if show_timestamps:
                 timestamp = self._format_timestamp(start)
                 line = f"[{timestamp}] {text}"
@@ -109,12 +107,12 @@ class JSONFormatter(Formatter):
     Formatter for JSON output.
     """
     
-    def format_transcript(self, transcript: List[Dict], **kwargs) -> str:
+    def format_transcript(self, transcript: Union[List[Dict], Transcript], **kwargs) -> str:
         """
         Format transcript as JSON.
         
         Args:
-            transcript: List of transcript entries
+            transcript: List of transcript entries or a Transcript
             **kwargs: Additional options (indent, ensure_ascii)
             
         Returns:
@@ -122,6 +120,9 @@ class JSONFormatter(Formatter):
         """
         indent = kwargs.get('indent', 2)
         ensure_ascii = kwargs.get('ensure_ascii', False)
+
+        if isinstance(transcript, Transcript):
+            transcript = transcript.to_list()
         
         return json.dumps(transcript, indent=indent, ensure_ascii=ensure_ascii)
 
@@ -131,24 +132,23 @@ class TextFormatter(Formatter):
     Formatter for plain text output.
     """
     
-    def format_transcript(self, transcript: List[Dict], **kwargs) -> str:
+    def format_transcript(self, transcript: Union[List[Dict], Transcript], **kwargs) -> str:
         """
         Format transcript as plain text.
         
         Args:
-            transcript: List of transcript entries
+            transcript: List of transcript entries or a Transcript
             **kwargs: Additional options (separator)
             
         Returns:
             Plain text transcript
         """
         separator = kwargs.get('separator', ' ')
+
+        if isinstance(transcript, Transcript):
+            return separator.join(transcript.texts())
         
-        text_parts = []
-        for entry in transcript:
-            text_parts.append(entry['text'])
-            
-        return separator.join(text_parts)
+        return separator.join(entry['text'] for entry in transcript)
 
 
 class SRTFormatter(Formatter):
@@ -156,22 +156,21 @@ class SRTFormatter(Formatter):
     Formatter for SRT (SubRip) subtitle format.
     """
     
-    def format_transcript(self, transcript: List[Dict], **kwargs) -> str:
+    def format_transcript(self, transcript: Union[List[Dict], Transcript], **kwargs) -> str:
         """
         Format transcript as SRT subtitles.
         
         Args:
-            transcript: List of transcript entries
+            transcript: List of transcript entries or a Transcript
             
         Returns:
             SRT formatted transcript
         """
         srt_entries = []
         
-        for i, entry in enumerate(transcript, 1):
-            start_time = self._format_srt_timestamp(entry['start'])
-            end_time = self._format_srt_timestamp(entry['start'] + entry['duration'])
-            text = entry['text']
+        for i, (text, start, duration) in enumerate(iter_segment_tuples(transcript), 1):
+            start_time = self._format_srt_timestamp(start)
+            end_time = self._format_srt_timestamp(start + duration)
             
             srt_entry = f"{i}\n{start_time} --> {end_time}\n{text}\n"
             srt_entries.append(srt_entry)
@@ -195,22 +194,21 @@ class VTTFormatter(Formatter):
     Formatter for WebVTT subtitle format.
     """
     
-    def format_transcript(self, transcript: List[Dict], **kwargs) -> str:
+    def format_transcript(self, transcript: Union[List[Dict], Transcript], **kwargs) -> str:
         """
         Format transcript as WebVTT subtitles.
         
         Args:
-            transcript: List of transcript entries
+            transcript: List of transcript entries or a Transcript
             
         Returns:
             WebVTT formatted transcript
         """
         vtt_entries = ["WEBVTT\n"]
         
-        for entry in transcript:
-            start_time = self._format_vtt_timestamp(entry['start'])
-            end_time = self._format_vtt_timestamp(entry['start'] + entry['duration'])
-            text = entry['text']
+        for text, start, duration in iter_segment_tuples(transcript):
+            start_time = self._format_vtt_timestamp(start)
+            end_time = self._format_vtt_timestamp(start + duration)
             
             vtt_entry = f"{start_time} --> {end_time}\n{text}\n"
             vtt_entries.append(vtt_entry)
@@ -0,0 +1,46 @@
+import json
+import re
+from typing import Dict, Optional
+
+
+# What may separate a marker such as ytInitialPlayerResponse from its object:
+# closing quote, whitespace and ':' or '='
+_ASSIGNMENT_RE = re.compile(r'["\']?\s*[:=]\s*')
+
+_DECODER = json.JSONDecoder()
+
+
+def extract_json_object(text: str, marker: str, start: int = 0) -> Optional[Dict]:
+    """
+    Decode the first JSON object assigned to marker in text.
+
+    Finds occurrences of marker (for example 'ytInitialPlayerResponse') that
+    are followed by ':' or '=' and an object literal, then decodes exactly that
+    object in place with JSONDecoder.raw_decode. The decoder is a single-pass,
+    string-aware scanner that stops at the matching closing brace, so nothing
+    backtracks and the object is never truncated at a '}' inside a string.
+
+    Args:
+        text: Text to search, typically a watch page
+        marker: Name the object is assigned to
+        start: Index to start searching from
+
+    Returns:
+        Decoded object, or None if no complete object follows the marker
+    """
+    pos = text.find(marker, start)
+
+    while pos != -1:
+        after_marker = pos + len(marker)
+        assignment = _ASSIGNMENT_RE.match(text, after_marker)
+
+        if assignment and text.startswith('{', assignment.end()):
+            try:
+                data, _ = _DECODER.raw_decode(text, assignment.end())
+                return data
+            except ValueError:
+                pass
+
+        pos = text.find(marker, after_marker)
+
+    return None
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+from typing import Dict
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket rate limiter with AIMD (additive-increase/multiplicative-decrease)
+    rate control.
+
+    Every request takes a token before it is sent. When YouTube answers with
+    429 Too Many Requests the rate is multiplied by decrease_factor and the
+    bucket is drained, so all callers sharing the limiter pause together
+    instead of backing off independently and stampeding again. Every
+    successful response grows the rate back, by roughly additive_increase
+    requests/second for each second of traffic at the current rate.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        min_rate: float = 0.2,
+        max_rate: float = 50.0,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        burst: float = None,
+        decrease_cooldown: float = 1.0
+    ):
+        """
+        Initialize AdaptiveRateLimiter.
+
+        Args:
+            rate: Initial rate in requests per second
+            min_rate: Lowest rate the limiter backs off to
+            max_rate: Highest rate the limiter grows to
+            additive_increase: Requests/second added per second of successful traffic
+            decrease_factor: Factor the rate is multiplied by on a 429
+            burst: Bucket capacity (defaults to one second of traffic at the current rate)
+            decrease_cooldown: Seconds during which further 429s do not shrink
+                the rate again (they usually belong to the same burst)
+        """
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("Rates must satisfy 0 < min_rate <= rate <= max_rate")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.burst = burst
+        self.decrease_cooldown = decrease_cooldown
+
+        self._rate = float(rate)
+        self._tokens = self._capacity()
+        self._updated_at = time.monotonic()
+        self._last_decrease = float('-inf')
+        self._successes = 0
+        self._throttles = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """
+        Current allowed rate in requests per second.
+        """
+        return self._rate
+
+    def _capacity(self) -> float:
+        return self.burst if self.burst is not None else max(1.0, self._rate)
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._capacity(), self._tokens + elapsed * self._rate)
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how long the caller must wait before sending.
+
+        Tokens may go negative, which queues callers in reservation order.
+
+        Returns:
+            Seconds to wait (0 if a token was available)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self):
+        """
+        Block until the caller may send a request.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """
+        Wait without blocking the event loop until the caller may send a request.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self):
+        """
+        Record a successful (non-throttled) response and grow the rate additively.
+        """
+        with self._lock:
+            self._successes += 1
+            self._rate = min(self.max_rate, self._rate + self.additive_increase / self._rate)
+
+    def on_throttle(self):
+        """
+        Record a 429 response, shrink the rate multiplicatively and drain the bucket.
+        """
+        with self._lock:
+            self._throttles += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_cooldown:
+                return
+            self._last_decrease = now
+            self._refill(now)
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Snapshot of the limiter state for monitoring.
+
+        Returns:
+            Dictionary with rate, min_rate, max_rate, tokens, successes and throttles
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'rate': self._rate,
+                'min_rate': self.min_rate,
+                'max_rate': self.max_rate,
+                'tokens': self._tokens,
+                'successes': self._successes,
+                'throttles': self._throttles
+            }
+
+    def __repr__(self):
+        return f"AdaptiveRateLimiter(rate={self._rate:.2f}, min_rate={self.min_rate}, max_rate={self.max_rate})"
+
+
+_default_rate_limiter = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> AdaptiveRateLimiter:
+    """
+    Return the process-wide AdaptiveRateLimiter.
+
+    Pass it to every Transport/AsyncTransport so all YouTube requests in the
+    process share one budget.
+    """
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        with _default_rate_limiter_lock:
+            if _default_rate_limiter is None:
+                _default_rate_limiter = AdaptiveRateLimiter()
+    return _default_rate_limiter
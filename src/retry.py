@@ -0,0 +1,179 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from exceptions import DeadlineExceeded
+
+
+class Deadline:
+    """
+    End-to-end time budget for one video.
+
+    The same Deadline is passed through the watch page, Innertube and
+    timedtext stages, so per-request timeouts and retry sleeps all draw on a
+    single budget instead of each stage getting its own.
+    """
+
+    def __init__(self, timeout: float):
+        """
+        Initialize Deadline.
+
+        Args:
+            timeout: Seconds from now until the deadline
+        """
+        self.timeout = timeout
+        self._expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """
+        Seconds left until the deadline (never negative).
+        """
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """
+        Whether the deadline has passed.
+        """
+        return time.monotonic() >= self._expires_at
+
+    def check(self, video_id: str):
+        """
+        Raise DeadlineExceeded if the deadline has passed.
+
+        Args:
+            video_id: YouTube video ID used in the error
+        """
+        if self.expired():
+            raise DeadlineExceeded(video_id, self.timeout)
+
+    def request_timeout(self, default: float) -> float:
+        """
+        Timeout for the next request: the default, capped by the time remaining.
+        """
+        return min(default, self.remaining())
+
+    def __repr__(self):
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining():.2f})"
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed YouTube request is retried.
+
+    Delays grow exponentially from base_delay up to max_delay with full
+    jitter, so concurrent callers do not retry in lockstep. A Retry-After
+    header on the response takes precedence over the computed delay.
+    """
+
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        backoff_factor: float = 2.0,
+        jitter: bool = True,
+        retry_statuses=None,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0
+    ):
+        """
+        Initialize RetryPolicy.
+
+        Args:
+            max_retries: Maximum number of retry attempts
+            base_delay: Delay before the first retry in seconds
+            max_delay: Upper bound for the computed delay in seconds
+            backoff_factor: Multiplier applied to the delay after every attempt
+            jitter: Whether to pick a random delay between 0 and the computed delay
+            retry_statuses: HTTP status codes worth retrying (defaults to
+                RETRYABLE_STATUS_CODES)
+            respect_retry_after: Whether to honour a Retry-After response header
+            max_retry_after: Upper bound for a Retry-After delay in seconds
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses) if retry_statuses is not None else self.RETRYABLE_STATUS_CODES
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """
+        Whether a response with this status code is worth retrying.
+        """
+        return status_code in self.retry_statuses
+
+    def next_delay(self, attempt: int, response=None, deadline: Deadline = None) -> Optional[float]:
+        """
+        Compute how long to wait before retrying.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            response: Failed response, if any (used for Retry-After)
+            deadline: Deadline of the video, if any
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+            (no attempts left, or the wait would run past the deadline)
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay = None
+        if self.respect_retry_after and response is not None:
+            delay = self._parse_retry_after(response.headers.get('Retry-After'))
+            if delay is not None:
+                delay = min(delay, self.max_retry_after)
+
+        if delay is None:
+            delay = min(self.max_delay, self.base_delay * (self.backoff_factor ** attempt))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+
+        return delay
+
+    def sleep(self, attempt: int, response=None, deadline: Deadline = None) -> bool:
+        """
+        Sleep before the next attempt.
+
+        Returns:
+            True if the caller should retry, False if it should give up
+        """
+        delay = self.next_delay(attempt, response, deadline)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header given either in seconds or as an HTTP date.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def __repr__(self):
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, jitter={self.jitter})"
+        )
@@ -0,0 +1,157 @@
+import html
+import re
+from functools import partial
+from typing import List, Dict, Iterable, Iterator, Tuple, Union
+
+from transcript import Transcript, iter_segment_tuples
+
+
+class TextNormalizer:
+    """
+    Reusable clean-up pipeline for transcript segment texts.
+
+    The enabled steps run in a fixed order (strip_tags, unescape,
+    remove_noise, collapse_whitespace) and the result is always stripped.
+    All patterns are compiled once per normalizer. normalize_many() and
+    normalize_segments() run every step once over a whole batch of texts
+    instead of once per segment.
+    """
+
+    DEFAULT_NOISE_MARKERS = (
+        'music', 'applause', 'laughter', 'cheering', 'inaudible', 'silence',
+        'müzik', 'alkış', 'alkışlar', 'gülüşmeler', 'kahkaha'
+    )
+
+    # Joins the texts of a batch; it never occurs in XML text, and no step
+    # matches across it, so the batch splits back into the same segments
+    _SEPARATOR = '\x00'
+    _TAG_PATTERN = re.compile(r'<[^>\x00]+>')
+    _WHITESPACE_PATTERN = re.compile(r'[^\S\x00]+')
+
+    def __init__(
+        self,
+        strip_tags: bool = True,
+        unescape: bool = True,
+        remove_noise: bool = False,
+        collapse_whitespace: bool = False,
+        noise_markers: Iterable[str] = None
+    ):
+        """
+        Initialize TextNormalizer.
+
+        Args:
+            strip_tags: Remove HTML tags such as <i> or <font color="...">
+            unescape: Decode HTML entities such as &amp; or &#39;
+            remove_noise: Remove sound markers such as [Music], (Applause) and ♪
+            collapse_whitespace: Replace runs of whitespace with a single space
+            noise_markers: Words recognised as [marker] or (marker) when
+                remove_noise is set (defaults to DEFAULT_NOISE_MARKERS)
+        """
+        self.strip_tags = strip_tags
+        self.unescape = unescape
+        self.remove_noise = remove_noise
+        self.collapse_whitespace = collapse_whitespace
+        self.noise_markers = tuple(noise_markers or self.DEFAULT_NOISE_MARKERS)
+
+        steps = []
+        if strip_tags:
+            steps.append(partial(self._TAG_PATTERN.sub, ''))
+        if unescape:
+            steps.append(html.unescape)
+        if remove_noise:
+            markers = '|'.join(re.escape(marker) for marker in self.noise_markers)
+            noise_pattern = re.compile(rf'[\[(]\s*(?:{markers})\s*[\])]|[♪♫]+', re.IGNORECASE)
+            steps.append(partial(noise_pattern.sub, ''))
+        if collapse_whitespace:
+            steps.append(partial(self._WHITESPACE_PATTERN.sub, ' '))
+        self._steps = steps
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize a single text.
+        """
+        for step in self._steps:
+            text = step(text)
+        return text.strip()
+
+    def normalize_many(self, texts: List[str]) -> List[str]:
+        """
+        Normalize a batch of texts, running each step once over all of them.
+
+        Args:
+            texts: Texts to normalize
+
+        Returns:
+            Normalized texts, in the same order
+        """
+        if not texts:
+            return []
+
+        batch = self._SEPARATOR.join(texts)
+        if batch.count(self._SEPARATOR) != len(texts) - 1:
+            # A text contains the separator itself: normalize one by one
+            return [self.normalize(text) for text in texts]
+
+        for step in self._steps:
+            batch = step(batch)
+        return [text.strip() for text in batch.split(self._SEPARATOR)]
+
+    def normalize_segments(
+        self,
+        segments: Iterable[Tuple[str, float, float]],
+        batch_size: int = 1024
+    ) -> Iterator[Tuple[str, float, float]]:
+        """
+        Normalize (text, start, duration) tuples in batches, dropping segments
+        whose text is empty afterwards.
+
+        The input is consumed batch_size segments at a time, so streamed
+        input is not collected in full.
+
+        Args:
+            segments: Iterable of (text, start, duration) tuples
+            batch_size: Number of segments normalized together
+
+        Yields:
+            Normalized (text, start, duration) tuples
+        """
+        batch = []
+        for segment in segments:
+            batch.append(segment)
+            if len(batch) >= batch_size:
+                yield from self._normalize_batch(batch)
+                batch = []
+        if batch:
+            yield from self._normalize_batch(batch)
+
+    def _normalize_batch(self, batch: List[Tuple[str, float, float]]) -> Iterator[Tuple[str, float, float]]:
+        texts = self.normalize_many([segment[0] for segment in batch])
+        for text, (_, start, duration) in zip(texts, batch):
+            if text:
+                yield (text, start, duration)
+
+    def normalize_transcript(self, transcript: Union[List[Dict], Transcript]) -> Union[List[Dict], Transcript]:
+        """
+        Normalize an already fetched transcript.
+
+        Args:
+            transcript: List of transcript entries or a Transcript
+
+        Returns:
+            A new transcript of the same type without the segments that end
+            up empty
+        """
+        segments = self.normalize_segments(iter_segment_tuples(transcript))
+        if isinstance(transcript, Transcript):
+            return Transcript(segments)
+        return [
+            {'text': text, 'start': start, 'duration': duration}
+            for text, start, duration in segments
+        ]
+
+    def __repr__(self):
+        steps = [
+            name for name in ('strip_tags', 'unescape', 'remove_noise', 'collapse_whitespace')
+            if getattr(self, name)
+        ]
+        return f"TextNormalizer({', '.join(steps)})"
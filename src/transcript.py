@@ -0,0 +1,146 @@
+from array import array
+from typing import List, Dict, Iterable, Iterator, Tuple, Union
+
+
+class Transcript:
+    """
+    Compact, columnar container for transcript segments.
+
+    Start times and durations live in two float arrays and all segment texts
+    are concatenated into one string with an offset array marking where each
+    segment ends. Compared to a list of {'text', 'start', 'duration'} dicts
+    this stores no per-segment objects or repeated keys, which cuts memory
+    several-fold for long transcripts.
+
+    A Transcript behaves like the legacy list: len(), indexing and iteration
+    yield the same dicts, and to_list() converts it back.
+    """
+
+    __slots__ = ('_starts', '_durations', '_text', '_offsets')
+
+    def __init__(self, segments: Iterable[Tuple[str, float, float]] = ()):
+        """
+        Initialize Transcript.
+
+        Args:
+            segments: Iterable of (text, start, duration) tuples
+        """
+        starts = array('d')
+        durations = array('d')
+        offsets = array('q', [0])
+        texts = []
+        end = 0
+
+        for text, start, duration in segments:
+            texts.append(text)
+            starts.append(start)
+            durations.append(duration)
+            end += len(text)
+            offsets.append(end)
+
+        self._starts = starts
+        self._durations = durations
+        self._text = ''.join(texts)
+        self._offsets = offsets
+
+    @classmethod
+    def from_list(cls, entries: List[Dict]) -> 'Transcript':
+        """
+        Build a Transcript from a list of {'text', 'start', 'duration'} dicts.
+        """
+        return cls((entry['text'], entry['start'], entry['duration']) for entry in entries)
+
+    @property
+    def starts(self) -> array:
+        """
+        Start times in seconds.
+        """
+        return self._starts
+
+    @property
+    def durations(self) -> array:
+        """
+        Durations in seconds.
+        """
+        return self._durations
+
+    def text_at(self, index: int) -> str:
+        """
+        Text of the segment at index.
+        """
+        if index < 0:
+            index += len(self._starts)
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+
+    def texts(self) -> Iterator[str]:
+        """
+        Iterate over segment texts without building dicts.
+        """
+        text = self._text
+        offsets = self._offsets
+        for index in range(len(self._starts)):
+            yield text[offsets[index]:offsets[index + 1]]
+
+    def iter_segments(self) -> Iterator[Tuple[str, float, float]]:
+        """
+        Iterate over (text, start, duration) tuples without building dicts.
+        """
+        return zip(self.texts(), self._starts, self._durations)
+
+    def to_list(self) -> List[Dict]:
+        """
+        Convert to the legacy list of {'text', 'start', 'duration'} dicts.
+        """
+        return [
+            {'text': text, 'start': start, 'duration': duration}
+            for text, start, duration in self.iter_segments()
+        ]
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for text, start, duration in self.iter_segments():
+            yield {'text': text, 'start': start, 'duration': duration}
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return Transcript(
+                (self.text_at(i), self._starts[i], self._durations[i])
+                for i in range(*index.indices(len(self)))
+            )
+        if not -len(self) <= index < len(self):
+            raise IndexError('Transcript index out of range')
+        return {
+            'text': self.text_at(index),
+            'start': self._starts[index],
+            'duration': self._durations[index]
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, Transcript):
+            return (
+                self._starts == other._starts
+                and self._durations == other._durations
+                and self._text == other._text
+                and self._offsets == other._offsets
+            )
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __bool__(self):
+        return len(self._starts) > 0
+
+    def __repr__(self):
+        return f"Transcript(segments={len(self)}, characters={len(self._text)})"
+
+
+def iter_segment_tuples(transcript) -> Iterator[Tuple[str, float, float]]:
+    """
+    Iterate over (text, start, duration) tuples of a Transcript or a legacy
+    list of dicts.
+    """
+    if isinstance(transcript, Transcript):
+        return transcript.iter_segments()
+    return ((entry['text'], entry['start'], entry['duration']) for entry in transcript)
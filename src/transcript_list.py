@@ -1,19 +1,87 @@
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
 from fetched_transcript import FetchedTranscript
+from transport import Transport
+from translation_languages import TranslationLanguages, base_language
 from exceptions import (
     NoTranscriptFound,
-    TranscriptNotFound,
-    NotTranslatable,
-    TranslationLanguageNotAvailable
+    TranscriptNotFound
 )
 
 
+class SelectionPlan:
+    """
+    Outcome of TranscriptList.plan(): the track chosen for a language
+    preference list and how it matched, e.g. for logging.
+    """
+
+    def __init__(
+        self,
+        video_id: str,
+        languages: List[str],
+        transcript: FetchedTranscript = None,
+        match: str = None,
+        source_language_code: str = None
+    ):
+        """
+        Initialize SelectionPlan.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Requested language codes in order of preference
+            transcript: Chosen transcript, or None if nothing matched
+            match: How it matched: 'exact', 'regional' (e.g. en-US served by en),
+                'translation' or 'default' (no languages were requested)
+            source_language_code: Language of the translated track, for translations
+        """
+        self.video_id = video_id
+        self.languages = languages
+        self.transcript = transcript
+        self.match = match
+        self.source_language_code = source_language_code
+
+    @property
+    def language_code(self) -> Optional[str]:
+        """
+        Language code of the chosen transcript.
+        """
+        return self.transcript.language_code if self.transcript else None
+
+    @property
+    def kind(self) -> Optional[str]:
+        """
+        Kind of the chosen transcript: 'manual', 'generated' or 'translated'.
+        """
+        return self.transcript.kind if self.transcript else None
+
+    def __bool__(self):
+        return self.transcript is not None
+
+    def __repr__(self):
+        if not self:
+            return f"SelectionPlan(video_id='{self.video_id}', languages={self.languages}, transcript=None)"
+        source = f", source_language_code='{self.source_language_code}'" if self.source_language_code else ""
+        return (
+            f"SelectionPlan(video_id='{self.video_id}', languages={self.languages}, "
+            f"language_code='{self.language_code}', kind='{self.kind}', match='{self.match}'{source})"
+        )
+
+
 class TranscriptList:
     """
     Represents a list of available transcripts for a YouTube video.
+
+    FetchedTranscript objects are created lazily, the first time a track is
+    looked up or iterated, and reused afterwards.
     """
     
-    def __init__(self, video_id: str, transcript_data: Dict, proxies: Dict = None, cookies: str = None):
+    def __init__(
+        self,
+        video_id: str,
+        transcript_data: Dict,
+        proxies: Dict = None,
+        cookies: str = None,
+        transport: Transport = None
+    ):
         """
         Initialize TranscriptList.
         
@@ -22,49 +90,179 @@ class TranscriptList:
             transcript_data: Dictionary containing transcript information
             proxies: Proxy configuration for requests
             cookies: Cookie string for authentication
+            transport: Shared HTTP transport passed to every FetchedTranscript
         """
         self.video_id = video_id
         self._transcript_data = transcript_data
         self._proxies = proxies
         self._cookies = cookies
+        self._transport = transport
         
-        # Build transcript objects
-        self._transcripts = {}
-        self._generated_transcripts = {}
-        self._manually_created_transcripts = {}
+        # Index the track infos; FetchedTranscripts are built on lookup
+        self._transcript_infos = {}
+        self._generated_infos = {}
+        self._manually_created_infos = {}
+        self._materialized = {}
+        self._regional_index = None
         
         for language_code, transcripts in transcript_data.items():
             for transcript_info in transcripts:
-                transcript = FetchedTranscript(
-                    video_id=video_id,
-                    language_code=language_code,
-                    language=transcript_info['language'],
-                    url=transcript_info['url'],
-                    is_generated=transcript_info['is_generated'],
-                    is_translatable=transcript_info['is_translatable'],
-                    translation_languages=transcript_info['translation_languages'],
-                    proxies=proxies,
-                    cookies=cookies
-                )
-                
-                self._transcripts[language_code] = transcript
+                if not isinstance(transcript_info['translation_languages'], TranslationLanguages):
+                    # Infos restored from a TrackListCache hold plain lists;
+                    # intern them once so lookups only index the shared table
+                    transcript_info = dict(
+                        transcript_info,
+                        translation_languages=TranslationLanguages.of(transcript_info['translation_languages'])
+                    )
+                self._transcript_infos[language_code] = transcript_info
                 
                 if transcript_info['is_generated']:
-                    self._generated_transcripts[language_code] = transcript
+                    self._generated_infos[language_code] = transcript_info
                 else:
-                    self._manually_created_transcripts[language_code] = transcript
+                    self._manually_created_infos[language_code] = transcript_info
+
+    def _transcript(self, language_code: str, transcript_info: Dict) -> FetchedTranscript:
+        """
+        Return the FetchedTranscript of a track, creating it on first use.
+        """
+        key = (language_code, transcript_info['is_generated'])
+        transcript = self._materialized.get(key)
+        if transcript is None:
+            transcript = FetchedTranscript(
+                video_id=self.video_id,
+                language_code=language_code,
+                language=transcript_info['language'],
+                url=transcript_info['url'],
+                is_generated=transcript_info['is_generated'],
+                is_translatable=transcript_info['is_translatable'],
+                translation_languages=transcript_info['translation_languages'],
+                proxies=self._proxies,
+                cookies=self._cookies,
+                transport=self._transport
+            )
+            # Concurrent lookups keep whichever object was stored first
+            transcript = self._materialized.setdefault(key, transcript)
+        return transcript
+
+    def _find_in(self, transcript_infos: Dict[str, Dict], language_codes: List[str]) -> Optional[FetchedTranscript]:
+        """
+        Find a track among transcript_infos for one of the language codes,
+        falling back to translating a translatable track; None if neither works.
+        """
+        for language_code in language_codes:
+            if language_code in transcript_infos:
+                return self._transcript(language_code, transcript_infos[language_code])
+                
+        # Try to find a translatable transcript
+        for language_code in language_codes:
+            for source_code, transcript_info in transcript_infos.items():
+                if not transcript_info['is_translatable']:
+                    continue
+                if transcript_info['translation_languages'].get_name(language_code) is not None:
+                    return self._transcript(source_code, transcript_info).translate(language_code)
+        return None
+
+    def plan(
+        self,
+        languages: List[str] = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> SelectionPlan:
+        """
+        Resolve a language preference list to the best available track in
+        one pass over a per-list language index, without network access.
+
+        Languages are tried in order of preference. For each one an original
+        track is looked for: the exact code before a regional fallback
+        (en-US -> en, pt -> pt-BR), and a manually created track before an
+        auto-generated one. Only when no preferred language has an original
+        track is one translated, preferring manually created sources. Without
+        languages, English (exact, then regional) is tried and then the first
+        listed track is used; nothing is translated.
+
+        The type filters apply to the track that is served or, for a
+        translation, translated.
+
+        Args:
+            languages: Language codes in order of preference
+            allow_manual: Whether manually created tracks may be used
+            allow_generated: Whether auto-generated tracks may be used
+            allow_translation: Whether a track may be translated
+
+        Returns:
+            SelectionPlan; falsy if no track satisfies the preferences
+        """
+        requested = list(languages) if languages else ['en']
+        sources = []
+        if allow_manual:
+            sources.append(self._manually_created_infos)
+        if allow_generated:
+            sources.append(self._generated_infos)
+
+        for language_code in requested:
+            for code, match in self._language_candidates(language_code):
+                for transcript_infos in sources:
+                    if code in transcript_infos:
+                        transcript = self._transcript(code, transcript_infos[code])
+                        return SelectionPlan(self.video_id, list(languages or []), transcript, match)
+
+        for language_code in requested if languages and allow_translation else ():
+            for transcript_infos in sources:
+                for source_code, transcript_info in transcript_infos.items():
+                    if not transcript_info['is_translatable']:
+                        continue
+                    target_code = transcript_info['translation_languages'].resolve(language_code)
+                    if target_code is not None:
+                        transcript = self._transcript(source_code, transcript_info).translate(target_code)
+                        return SelectionPlan(self.video_id, list(languages or []), transcript, 'translation', source_code)
+
+        if not languages:
+            for language_code, transcripts in self._transcript_data.items():
+                for transcript_info in transcripts:
+                    allowed = allow_generated if transcript_info['is_generated'] else allow_manual
+                    if allowed:
+                        transcript = self._transcript(language_code, transcript_info)
+                        return SelectionPlan(self.video_id, [], transcript, 'default')
+
+        return SelectionPlan(self.video_id, list(languages or []))
+
+    def _language_candidates(self, language_code: str) -> List[Tuple[str, str]]:
+        """
+        Listed track codes serving language_code, best first, as (code, match) pairs.
+        """
+        if self._regional_index is None:
+            # Base language -> listed codes, built once per list
+            regional_index = {}
+            for code in self._transcript_infos:
+                regional_index.setdefault(base_language(code), []).append(code)
+            self._regional_index = regional_index
+
+        candidates = []
+        if language_code in self._transcript_infos:
+            candidates.append((language_code, 'exact'))
+        base = base_language(language_code)
+        if base in self._transcript_infos and base != language_code:
+            candidates.append((base, 'regional'))
+        for code in self._regional_index.get(base, ()):
+            if code != language_code and code != base:
+                candidates.append((code, 'regional'))
+        return candidates
 
     def __iter__(self):
         """
         Iterate over all available transcripts.
         """
-        return iter(self._transcripts.values())
+        return (
+            self._transcript(language_code, transcript_info)
+            for language_code, transcript_info in self._transcript_infos.items()
+        )
 
     def __len__(self):
         """
         Return the number of available transcripts.
         """
-        return len(self._transcripts)
+        return len(self._transcript_infos)
 
     def find_transcript(self, language_codes: List[str]) -> FetchedTranscript:
         """
@@ -79,19 +277,10 @@ class TranscriptList:
         Raises:
             NoTranscriptFound: If no transcript is found for any of the languages
         """
-        for language_code in language_codes:
-            if language_code in self._transcripts:
-                return self._transcripts[language_code]
-                
-        # Try to find a translatable transcript
-        for language_code in language_codes:
-            for transcript in self._transcripts.values():
-                if transcript.is_translatable:
-                    try:
-                        return transcript.translate(language_code)
-                    except (NotTranslatable, TranslationLanguageNotAvailable):
-                        continue
-                        
+        transcript = self._find_in(self._transcript_infos, language_codes)
+        if transcript is not None:
+            return transcript
+
         raise NoTranscriptFound(self.video_id, language_codes, self._transcript_data)
 
     def find_generated_transcript(self, language_codes: List[str]) -> FetchedTranscript:
@@ -107,19 +296,10 @@ class TranscriptList:
         Raises:
             NoTranscriptFound: If no auto-generated transcript is found
         """
-        for language_code in language_codes:
-            if language_code in self._generated_transcripts:
-                return self._generated_transcripts[language_code]
-                
-        # Try to find a translatable auto-generated transcript
-        for language_code in language_codes:
-            for transcript in self._generated_transcripts.values():
-                if transcript.is_translatable:
-                    try:
-                        return transcript.translate(language_code)
-                    except (NotTranslatable, TranslationLanguageNotAvailable):
-                        continue
-                        
+        transcript = self._find_in(self._generated_infos, language_codes)
+        if transcript is not None:
+            return transcript
+
         raise NoTranscriptFound(self.video_id, language_codes, self._transcript_data)
 
     def find_manually_created_transcript(self, language_codes: List[str]) -> FetchedTranscript:
@@ -135,19 +315,10 @@ class TranscriptList:
         Raises:
             NoTranscriptFound: If no manually created transcript is found
         """
-        for language_code in language_codes:
-            if language_code in self._manually_created_transcripts:
-                return self._manually_created_transcripts[language_code]
-                
-        # Try to find a translatable manually created transcript
-        for language_code in language_codes:
-            for transcript in self._manually_created_transcripts.values():
-                if transcript.is_translatable:
-                    try:
-                        return transcript.translate(language_code)
-                    except (NotTranslatable, TranslationLanguageNotAvailable):
-                        continue
-                        
+        transcript = self._find_in(self._manually_created_infos, language_codes)
+        if transcript is not None:
+            return transcript
+
         raise NoTranscriptFound(self.video_id, language_codes, self._transcript_data)
 
     def get_languages(self) -> List[str]:
@@ -157,7 +328,7 @@ class TranscriptList:
         Returns:
             List of language codes
         """
-        return list(self._transcripts.keys())
+        return list(self._transcript_infos.keys())
 
     def get_generated_languages(self) -> List[str]:
         """
@@ -166,7 +337,7 @@ class TranscriptList:
         Returns:
             List of language codes for auto-generated transcripts
         """
-        return list(self._generated_transcripts.keys())
+        return list(self._generated_infos.keys())
 
     def get_manually_created_languages(self) -> List[str]:
         """
@@ -175,7 +346,7 @@ class TranscriptList:
         Returns:
             List of language codes for manually created transcripts
         """
-        return list(self._manually_created_transcripts.keys())
+        return list(self._manually_created_infos.keys())
 
     def is_translatable(self, language_code: str) -> bool:
         """
@@ -187,11 +358,11 @@ class TranscriptList:
         Returns:
             True if transcript is translatable, False otherwise
         """
-        if language_code in self._transcripts:
-            return self._transcripts[language_code].is_translatable
+        if language_code in self._transcript_infos:
+            return self._transcript_infos[language_code]['is_translatable']
         return False
 
-    def get_translation_languages(self, language_code: str) -> List[Dict[str, str]]:
+    def get_translation_languages(self, language_code: str) -> TranslationLanguages:
         """
         Get available translation languages for a transcript.
         
@@ -199,22 +370,23 @@ class TranscriptList:
             language_code: Source language code
             
         Returns:
-            List of dictionaries with language_code and language name
+            Shared, read-only TranslationLanguages table (a sequence of
+            dictionaries with language_code and language name)
         """
-        if language_code in self._transcripts:
-            return self._transcripts[language_code].translation_languages
-        return []
+        if language_code in self._transcript_infos:
+            return self._transcript_infos[language_code]['translation_languages']
+        return TranslationLanguages.of(())
 
     def __repr__(self):
         """
         String representation of TranscriptList.
         """
         transcript_info = []
-        for transcript in self._transcripts.values():
-            info = f"{transcript.language_code} ({transcript.language})"
-            if transcript.is_generated:
+        for language_code, track in self._transcript_infos.items():
+            info = f"{language_code} ({track['language']})"
+            if track['is_generated']:
                 info += " [GENERATED]"
-            if transcript.is_translatable:
+            if track['is_translatable']:
                 info += " [TRANSLATABLE]"
             transcript_info.append(info)
             
@@ -0,0 +1,102 @@
+from functools import lru_cache
+from typing import List, Dict, Iterable, Optional, Tuple
+
+
+class TranslationLanguages(tuple):
+    """
+    Read-only table of the languages a transcript can be translated to.
+
+    Behaves like the legacy list of {'language_code', 'language'} dicts
+    (len, indexing, iteration, comparison with a list, JSON serialization)
+    and adds an O(1) language code to name index. Tables are interned, so
+    every track of a video, and every video offering the same languages,
+    shares a single instance instead of its own copy.
+    """
+
+    def __new__(cls, pairs: Iterable[Tuple[str, str]] = ()):
+        """
+        Create a table from (language_code, language) pairs.
+
+        Prefer of() and from_captions(), which return shared instances.
+        """
+        pairs = tuple(pairs)
+        table = super().__new__(cls, ({'language_code': code, 'language': name} for code, name in pairs))
+        table._names = dict(pairs)
+        table._regional = None
+        return table
+
+    @classmethod
+    def of(cls, languages: Iterable[Dict[str, str]] = None) -> 'TranslationLanguages':
+        """
+        Return the shared table for a list of {'language_code', 'language'}
+        dicts; a TranslationLanguages is returned as is.
+        """
+        if isinstance(languages, cls):
+            return languages
+        return _shared_table(tuple((lang['language_code'], lang['language']) for lang in languages or ()))
+
+    @classmethod
+    def from_captions(cls, translation_languages: List[Dict]) -> 'TranslationLanguages':
+        """
+        Return the shared table for the raw 'translationLanguages' list of a
+        playerCaptionsTracklistRenderer.
+        """
+        return _shared_table(tuple(
+            (lang.get('languageCode', ''), lang.get('languageName', {}).get('simpleText', ''))
+            for lang in translation_languages
+        ))
+
+    def get_name(self, language_code: str) -> Optional[str]:
+        """
+        Name of a translation language, or None if it is not available.
+        """
+        return self._names.get(language_code)
+
+    def resolve(self, language_code: str) -> Optional[str]:
+        """
+        Code of the table entry best matching language_code: the code itself,
+        else its base language (en-US -> en), else a regional variant of that
+        base (pt -> pt-BR); None if the language is not available at all.
+        """
+        if language_code in self._names:
+            return language_code
+        base = base_language(language_code)
+        if base in self._names:
+            return base
+        if self._regional is None:
+            regional = {}
+            for code in self._names:
+                regional.setdefault(base_language(code), code)
+            self._regional = regional
+        return self._regional.get(base)
+
+    def codes(self) -> List[str]:
+        """
+        Codes of all translation languages, in table order.
+        """
+        return list(self._names)
+
+    def __getnewargs__(self):
+        return (tuple((lang['language_code'], lang['language']) for lang in self),)
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return tuple.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TranslationLanguages(languages={len(self)})"
+
+
+def base_language(language_code: str) -> str:
+    """
+    Base language of a code: 'en-US' -> 'en', 'zh-Hans' -> 'zh', 'de' -> 'de'.
+    """
+    return language_code.split('-', 1)[0].lower()
+
+
+@lru_cache(maxsize=64)
+def _shared_table(pairs: Tuple[Tuple[str, str], ...]) -> TranslationLanguages:
+    return TranslationLanguages(pairs)
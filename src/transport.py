@@ -0,0 +1,411 @@
+import asyncio
+import json
+import threading
+import time
+import urllib.parse
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from proxy_pool import ProxyPool
+from rate_limiter import AdaptiveRateLimiter, get_default_rate_limiter
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for AsyncTransport
+    aiohttp = None
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """
+    Cookie policy that never stores response cookies on the shared session.
+    """
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+class Transport:
+    """
+    Pooled HTTP transport shared by YouTubeTranscriptApi, TranscriptList and
+    FetchedTranscript.
+
+    A single Transport keeps TCP/TLS connections alive between requests, so
+    the watch page, Innertube and timedtext calls for many videos reuse the
+    same connections instead of paying a fresh handshake each time.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        headers: Dict[str, str] = None,
+        timeout: float = 30,
+        rate_limiter: AdaptiveRateLimiter = None
+    ):
+        """
+        Initialize Transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Whether to block instead of opening extra connections
+                once a host's pool is exhausted (a hard per-host limit)
+            keep_alive: Whether to keep connections open between requests
+            headers: Default headers sent with every request
+            timeout: Default request timeout in seconds
+            rate_limiter: Limiter every request waits on and reports 429s to
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+        self._session = requests.Session()
+        self._session.cookies.set_policy(_RejectAllCookiesPolicy())
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        self._session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self._session.headers.update(headers)
+        self._session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        Default headers sent with every request.
+        """
+        return self._session.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] = None,
+        proxies: Dict = None,
+        cookies: str = None,
+        timeout: float = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send an HTTP request over the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Extra headers for this request only
+            proxies: Proxy configuration for this request only, either a dict
+                or a ProxyPool to pick a proxy from
+            cookies: Cookie string for authentication
+            timeout: Request timeout in seconds (defaults to the transport timeout)
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            requests.Response object
+        """
+        request_headers = dict(headers) if headers else {}
+        if cookies:
+            request_headers['Cookie'] = cookies
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        endpoint = None
+        if isinstance(proxies, ProxyPool):
+            endpoint = proxies.acquire()
+            started = time.monotonic()
+
+        try:
+            response = self._session.request(
+                method,
+                url,
+                headers=request_headers,
+                proxies=endpoint.proxies if endpoint else proxies,
+                timeout=self.timeout if timeout is None else timeout,
+                **kwargs
+            )
+        except Exception:
+            if endpoint:
+                proxies.release(endpoint, time.monotonic() - started, error=True)
+            raise
+
+        if endpoint:
+            proxies.release(endpoint, time.monotonic() - started, response.status_code)
+        if self.rate_limiter:
+            _report_status(self.rate_limiter, response.status_code)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request. See request() for arguments.
+        """
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a POST request. See request() for arguments.
+        """
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return (
+            f"Transport(pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, "
+            f"pool_block={self.pool_block}, keep_alive={self.keep_alive})"
+        )
+
+
+def _report_status(rate_limiter: AdaptiveRateLimiter, status_code: int):
+    """
+    Feed a response status back into the AIMD rate control.
+    """
+    if status_code == 429:
+        rate_limiter.on_throttle()
+    elif status_code < 500:
+        rate_limiter.on_success()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    Return the process-wide Transport used when none is passed explicitly.
+
+    It shares the process-wide AdaptiveRateLimiter.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = Transport(rate_limiter=get_default_rate_limiter())
+    return _default_transport
+
+
+class AsyncResponse:
+    """
+    Fully read HTTP response returned by AsyncTransport.
+    """
+
+    def __init__(self, status_code: int, text: str, headers, url: str):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+        self.url = url
+
+    def json(self):
+        """
+        Decode the response body as JSON.
+        """
+        return json.loads(self.text)
+
+
+class AsyncTransport:
+    """
+    Pooled asyncio HTTP transport backed by aiohttp.
+
+    One AsyncTransport owns a single aiohttp session, so every coroutine that
+    shares it reuses the same keep-alive connections. The session is opened
+    lazily inside the running event loop.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keep_alive: bool = True,
+        keepalive_timeout: float = 15,
+        headers: Dict[str, str] = None,
+        timeout: float = 30,
+        rate_limiter: AdaptiveRateLimiter = None
+    ):
+        """
+        Initialize AsyncTransport.
+
+        Args:
+            limit: Maximum number of simultaneous connections (0 for no limit)
+            limit_per_host: Maximum simultaneous connections per host (0 for no limit)
+            keep_alive: Whether to keep connections open between requests
+            keepalive_timeout: Seconds an idle connection is kept open
+            headers: Default headers sent with every request
+            timeout: Default request timeout in seconds
+            rate_limiter: Limiter every request waits on and reports 429s to
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncTransport requires aiohttp. Install it with: pip install u-transkript[async]"
+            )
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self._session = None
+
+    def _get_session(self):
+        """
+        Return the aiohttp session, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            if self.keep_alive:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout
+                )
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    force_close=True
+                )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                cookie_jar=aiohttp.DummyCookieJar()
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] = None,
+        proxies: Dict = None,
+        cookies: str = None,
+        timeout: float = None,
+        **kwargs
+    ) -> AsyncResponse:
+        """
+        Send an HTTP request and read the whole response body.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Extra headers for this request only
+            proxies: Proxy configuration in requests format ({'https': url, ...})
+                or a ProxyPool to pick a proxy from
+            cookies: Cookie string for authentication
+            timeout: Request timeout in seconds (defaults to the transport timeout)
+            **kwargs: Passed through to aiohttp.ClientSession.request
+
+        Returns:
+            AsyncResponse object
+        """
+        request_headers = dict(headers) if headers else {}
+        if cookies:
+            request_headers['Cookie'] = cookies
+
+        client_timeout = aiohttp.ClientTimeout(total=self.timeout if timeout is None else timeout)
+
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+
+        pool = proxies if isinstance(proxies, ProxyPool) else None
+        endpoint = None
+        if pool:
+            endpoint = pool.acquire()
+            proxies = endpoint.proxies
+            started = time.monotonic()
+
+        proxy = None
+        if proxies:
+            scheme = urllib.parse.urlsplit(url).scheme
+            proxy = proxies.get(scheme) or proxies.get('all')
+
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                headers=request_headers,
+                proxy=proxy,
+                timeout=client_timeout,
+                **kwargs
+            ) as response:
+                if self.rate_limiter:
+                    _report_status(self.rate_limiter, response.status)
+                text = await response.text()
+        except asyncio.CancelledError:
+            if endpoint:
+                pool.cancel(endpoint)
+            raise
+        except Exception:
+            if endpoint:
+                pool.release(endpoint, time.monotonic() - started, error=True)
+            raise
+
+        if endpoint:
+            pool.release(endpoint, time.monotonic() - started, response.status)
+        return AsyncResponse(response.status, text, response.headers, str(response.url))
+
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        """
+        Send a GET request. See request() for arguments.
+        """
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        """
+        Send a POST request. See request() for arguments.
+        """
+        return await self.request('POST', url, **kwargs)
+
+    async def close(self):
+        """
+        Close the aiohttp session and all pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __repr__(self):
+        return (
+            f"AsyncTransport(limit={self.limit}, limit_per_host={self.limit_per_host}, "
+            f"keep_alive={self.keep_alive})"
+        )
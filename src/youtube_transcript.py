@@ -1,9 +1,12 @@
-import json
 import re
 import requests
+import threading
 import time
 import urllib.parse
-from typing import List, Dict, Optional, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as futures_wait
+from functools import partial
+from typing import List, Dict, Optional, Union, Iterable, Iterator
 from xml.etree import ElementTree
 
 from exceptions import (
@@ -19,6 +22,60 @@ from exceptions import (
 )
 from transcript_list import TranscriptList
 from fetched_transcript import FetchedTranscript
+from transport import Transport, get_default_transport
+from rate_limiter import get_default_rate_limiter
+from retry import RetryPolicy, Deadline
+from caching import TranscriptCache, TrackListCache, NegativeResultCache
+from transcript import Transcript
+from translation_languages import TranslationLanguages
+from json_extractor import extract_json_object
+
+
+class InnertubeKeyCache:
+    """
+    Thread-safe cache for the Innertube API key scraped from a watch page.
+
+    The key is effectively constant across videos, so once one watch page has
+    been downloaded later videos can call the player endpoint directly.
+    """
+
+    def __init__(self, ttl: float = 3600):
+        """
+        Initialize InnertubeKeyCache.
+
+        Args:
+            ttl: Seconds a cached key stays valid before a watch page is needed again
+        """
+        self.ttl = ttl
+        self._api_key = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[str]:
+        """
+        Return the cached key, or None if there is none or it has expired.
+        """
+        with self._lock:
+            if self._api_key and time.monotonic() < self._expires_at:
+                return self._api_key
+            return None
+
+    def set(self, api_key: str):
+        """
+        Store a freshly scraped key and restart its TTL.
+        """
+        with self._lock:
+            self._api_key = api_key
+            self._expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self, api_key: str = None):
+        """
+        Drop the cached key. If api_key is given, only drop it if it is still current.
+        """
+        with self._lock:
+            if api_key is None or api_key == self._api_key:
+                self._api_key = None
+                self._expires_at = 0.0
 
 
 class YouTubeTranscriptApi:
@@ -27,7 +84,16 @@ class YouTubeTranscriptApi:
     """
     
     _WATCH_URL = 'https://www.youtube.com/watch?v={video_id}'
+    _WATCH_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Upgrade-Insecure-Requests': '1',
+    }
     _API_BASE_URL = 'https://www.youtube.com/api/timedtext'
+    _INNERTUBE_PLAYER_URL = 'https://www.youtube.com/youtubei/v1/player?key={api_key}'
+    _INNERTUBE_HEADERS = {'Content-Type': 'application/json'}
+    # Player endpoint statuses meaning the API key itself was rejected
+    _REJECTED_KEY_STATUSES = frozenset({400, 403})
+    _innertube_key_cache = InnertubeKeyCache()
     
     @classmethod
     def get_transcript(
@@ -36,8 +102,21 @@ class YouTubeTranscriptApi:
         languages: List[str] = None,
         proxies: Dict = None,
         cookies: str = None,
-        preserve_formatting: bool = False
-    ) -> List[Dict]:
+        preserve_formatting: bool = False,
+        transport: Transport = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        cache: TranscriptCache = None,
+        track_cache: TrackListCache = None,
+        negative_cache: NegativeResultCache = None,
+        compact: bool = False,
+        stream: bool = False,
+        fmt: str = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> Union[List[Dict], Transcript]:
         """
         Retrieve transcript for a single video.
         
@@ -47,70 +126,163 @@ class YouTubeTranscriptApi:
             proxies: Proxy configuration for requests
             cookies: Cookie string for authentication
             preserve_formatting: Whether to preserve HTML formatting
+            transport: Shared HTTP transport (defaults to the process-wide one)
+            direct_innertube: Skip the watch page when an Innertube API key is cached
+            retry_policy: RetryPolicy used by every stage
+            timeout: End-to-end time budget in seconds for this video, covering
+                all requests and retries (raises DeadlineExceeded when spent)
+            cache: TranscriptCache answering repeat requests without any network access
+            track_cache: TrackListCache answering repeat listings without any network access
+            negative_cache: NegativeResultCache re-raising remembered "no transcript"
+                errors without any network access
+            compact: Whether to return a columnar Transcript instead of a list of dicts
+            stream: Whether to parse the timedtext response incrementally while it downloads
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            allow_manual: Whether a manually created track may be used
+            allow_generated: Whether an auto-generated track may be used
+            allow_translation: Whether a track may be translated to a requested language
             
         Returns:
-            List of transcript entries with 'text', 'start', and 'duration' keys
+            List of transcript entries with 'text', 'start', and 'duration' keys,
+            or a Transcript if compact is set
         """
-        transcript_list = cls.list_transcripts(video_id, proxies=proxies, cookies=cookies)
-        
+        if cache is not None:
+            cached = cls._find_cached_transcript(
+                cache,
+                video_id,
+                languages,
+                preserve_formatting,
+                allow_manual=allow_manual,
+                allow_generated=allow_generated,
+                allow_translation=allow_translation
+            )
+            if cached is not None:
+                return Transcript.from_list(cached) if compact else cached
+
+        if negative_cache is not None:
+            negative_cache.check(video_id, languages)
+
+        deadline = Deadline(timeout) if timeout is not None else None
+
+        try:
+            transcript_list = cls.list_transcripts(
+                video_id,
+                proxies=proxies,
+                cookies=cookies,
+                transport=transport,
+                direct_innertube=direct_innertube,
+                retry_policy=retry_policy,
+                deadline=deadline,
+                track_cache=track_cache
+            )
+            transcript = cls._select_transcript(
+                transcript_list,
+                languages,
+                allow_manual=allow_manual,
+                allow_generated=allow_generated,
+                allow_translation=allow_translation
+            )
+            if cache is not None:
+                cache.record_selection(
+                    video_id,
+                    TranscriptCache.selection_key(languages, allow_manual, allow_generated, allow_translation),
+                    transcript.language_code,
+                    transcript.cache_kind
+                )
+            return transcript.fetch(
+                preserve_formatting=preserve_formatting,
+                retry_policy=retry_policy,
+                deadline=deadline,
+                cache=cache,
+                compact=compact,
+                stream=stream,
+                fmt=fmt
+            )
+        except TranscriptRetrievalError as e:
+            if negative_cache is not None and cls._is_negative_cacheable(e, allow_manual, allow_generated, allow_translation):
+                negative_cache.record(e, languages)
+            raise
+
+    @classmethod
+    def _is_negative_cacheable(
+        cls,
+        error: TranscriptRetrievalError,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> bool:
+        """
+        Whether error may be remembered in a NegativeResultCache: a missing
+        transcript found with type filters does not hold for other requests.
+        """
+        if allow_manual and allow_generated and allow_translation:
+            return True
+        return not isinstance(error, (NoTranscriptFound, TranscriptNotFound))
+
+    @classmethod
+    def _find_cached_transcript(
+        cls,
+        cache: TranscriptCache,
+        video_id: str,
+        languages: List[str] = None,
+        preserve_formatting: bool = False,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> Optional[List[Dict]]:
+        """
+        Look up the transcript _select_transcript picked for the same
+        languages and type filters before, without listing tracks.
+
+        Only the selection recorded for exactly this request is served, so a
+        transcript cached by a request with other filters (e.g. a generated
+        track fetched with allow_manual=False) never hides the track this
+        request would pick.
+
+        Returns:
+            Cached transcript entries, or None on a miss
+        """
+        selection = TranscriptCache.selection_key(languages, allow_manual, allow_generated, allow_translation)
+        return cache.find_selected(video_id, selection, preserve_formatting)
+
+    @classmethod
+    def _select_transcript(
+        cls,
+        transcript_list: TranscriptList,
+        languages: List[str] = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> FetchedTranscript:
+        """
+        Pick the transcript get_transcript should fetch, without any network access.
+
+        Args:
+            transcript_list: TranscriptList of the video
+            languages: List of language codes in order of preference
+            allow_manual: Whether a manually created track may be used
+            allow_generated: Whether an auto-generated track may be used
+            allow_translation: Whether a track may be translated
+
+        Returns:
+            FetchedTranscript object to fetch (see TranscriptList.plan for the order)
+
+        Raises:
+            NoTranscriptFound: If none of the requested languages is available
+            TranscriptNotFound: If no languages were requested and no track
+                (passing the type filters) exists
+        """
+        plan = transcript_list.plan(
+            languages,
+            allow_manual=allow_manual,
+            allow_generated=allow_generated,
+            allow_translation=allow_translation
+        )
+        if plan:
+            return plan.transcript
         if languages:
-            for language_code in languages:
-                try:
-                    transcript = transcript_list.find_transcript([language_code])
-                    return transcript.fetch(preserve_formatting=preserve_formatting)
-                except (NoTranscriptFound, TranscriptNotFound):
-                    continue
-            
-            # If no exact match found, try to get a translatable transcript
-            try:
-                transcript = transcript_list.find_manually_created_transcript(languages)
-                if transcript.is_translatable:
-                    if languages:
-                        target_lang_code_for_translation = languages[0]
-                        try:
-                            translated = transcript.translate(target_lang_code_for_translation)
-                            return translated.fetch(preserve_formatting=preserve_formatting)
-                        except Exception:
-                            pass
-            except (NoTranscriptFound, TranscriptNotFound):
-                pass
-                
-            raise NoTranscriptFound(video_id, languages, transcript_list._transcript_data if hasattr(transcript_list, '_transcript_data') else {})
-        else:
-            # No specific languages requested, try common fallbacks
-            try:
-                # Attempt to find an English generated transcript
-                transcript = transcript_list.find_generated_transcript(['en'])
-                return transcript.fetch(preserve_formatting=preserve_formatting)
-            except NoTranscriptFound: 
-                try:
-                    # Attempt to find an English manually created transcript
-                    transcript = transcript_list.find_manually_created_transcript(['en'])
-                    return transcript.fetch(preserve_formatting=preserve_formatting)
-                except NoTranscriptFound: 
-                    # Fallback to the very first transcript available in the list
-                    if transcript_list._transcript_data:
-                        first_transcript_info_dict = None
-                        for lang_key in transcript_list._transcript_data: 
-                            if transcript_list._transcript_data[lang_key]: 
-                                first_transcript_info_dict = transcript_list._transcript_data[lang_key][0]
-                                break 
-
-                        if first_transcript_info_dict:
-                            actual_transcript_object = FetchedTranscript(
-                                video_id=video_id,
-                                language_code=first_transcript_info_dict['language_code'],
-                                language=first_transcript_info_dict['language'],
-                                url=first_transcript_info_dict['url'],
-                                is_generated=first_transcript_info_dict['is_generated'],
-                                is_translatable=first_transcript_info_dict['is_translatable'],
-                                translation_languages=first_transcript_info_dict.get('translation_languages', []),
-                                proxies=proxies,
-                                cookies=cookies
-                            )
-                            return actual_transcript_object.fetch(preserve_formatting=preserve_formatting)
-                    # If after all this, no transcript is found
-                    raise TranscriptNotFound(video_id)
+            raise NoTranscriptFound(transcript_list.video_id, languages, transcript_list._transcript_data)
+        raise TranscriptNotFound(transcript_list.video_id)
 
     @classmethod
     def get_transcripts(
@@ -120,7 +292,21 @@ class YouTubeTranscriptApi:
         proxies: Dict = None,
         cookies: str = None,
         preserve_formatting: bool = False,
-        continue_on_failure: bool = False
+        continue_on_failure: bool = False,
+        transport: Transport = None,
+        max_workers: int = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        cache: TranscriptCache = None,
+        track_cache: TrackListCache = None,
+        negative_cache: NegativeResultCache = None,
+        compact: bool = False,
+        stream: bool = False,
+        fmt: str = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
     ) -> List[Dict]:
         """
         Retrieve transcripts for multiple videos.
@@ -132,37 +318,203 @@ class YouTubeTranscriptApi:
             cookies: Cookie string for authentication
             preserve_formatting: Whether to preserve HTML formatting
             continue_on_failure: Whether to continue if a video fails
+            transport: Shared HTTP transport reused for every video
+            max_workers: Number of videos fetched concurrently on a thread
+                pool (None or 1 fetches them one after another)
+            direct_innertube: Skip the watch page when an Innertube API key is cached
+            retry_policy: RetryPolicy used by every stage of every video
+            timeout: End-to-end time budget in seconds for each video
+            cache: TranscriptCache shared by every video
+            track_cache: TrackListCache shared by every video
+            negative_cache: NegativeResultCache shared by every video
+            compact: Whether transcripts are columnar Transcript objects
+            stream: Whether to parse timedtext responses incrementally while they download
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            allow_manual: Whether manually created tracks may be used
+            allow_generated: Whether auto-generated tracks may be used
+            allow_translation: Whether tracks may be translated to a requested language
             
         Returns:
-            List of dictionaries with video_id and transcript data
+            List of dictionaries with video_id and transcript data, in the
+            same order as video_ids
         """
-        results = []
-        
-        for video_id in video_ids:
+        return list(cls.iter_transcripts(
+            video_ids,
+            languages=languages,
+            proxies=proxies,
+            cookies=cookies,
+            preserve_formatting=preserve_formatting,
+            continue_on_failure=continue_on_failure,
+            transport=transport,
+            max_workers=max_workers,
+            direct_innertube=direct_innertube,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            cache=cache,
+            track_cache=track_cache,
+            negative_cache=negative_cache,
+            compact=compact,
+            stream=stream,
+            fmt=fmt,
+            allow_manual=allow_manual,
+            allow_generated=allow_generated,
+            allow_translation=allow_translation
+        ))
+
+    @classmethod
+    def iter_transcripts(
+        cls,
+        video_ids: Iterable[str],
+        languages: List[str] = None,
+        proxies: Dict = None,
+        cookies: str = None,
+        preserve_formatting: bool = False,
+        continue_on_failure: bool = True,
+        transport: Transport = None,
+        max_workers: int = None,
+        ordered: bool = True,
+        max_in_flight: int = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        cache: TranscriptCache = None,
+        track_cache: TrackListCache = None,
+        negative_cache: NegativeResultCache = None,
+        compact: bool = False,
+        stream: bool = False,
+        fmt: str = None,
+        allow_manual: bool = True,
+        allow_generated: bool = True,
+        allow_translation: bool = True
+    ) -> Iterator[Dict]:
+        """
+        Retrieve transcripts for multiple videos, yielding each result as soon
+        as it is available.
+
+        video_ids is consumed lazily and at most max_in_flight videos are
+        submitted ahead of the consumer, so memory stays flat however many
+        videos are processed and a slow consumer throttles the fetching.
+
+        Args:
+            video_ids: Iterable of YouTube video IDs (may be a generator)
+            languages: List of language codes in order of preference
+            proxies: Proxy configuration for requests
+            cookies: Cookie string for authentication
+            preserve_formatting: Whether to preserve HTML formatting
+            continue_on_failure: Whether to yield failed videos with their error
+                instead of raising
+            transport: Shared HTTP transport reused for every video
+            max_workers: Number of videos fetched concurrently on a thread
+                pool (None or 1 fetches them one after another)
+            ordered: Whether to yield results in the order of video_ids;
+                False yields them in completion order
+            max_in_flight: Maximum number of videos submitted but not yet
+                yielded (defaults to twice max_workers)
+            direct_innertube: Skip the watch page when an Innertube API key is cached
+            retry_policy: RetryPolicy used by every stage of every video
+            timeout: End-to-end time budget in seconds for each video
+            cache: TranscriptCache shared by every video
+            track_cache: TrackListCache shared by every video
+            negative_cache: NegativeResultCache shared by every video
+            compact: Whether transcripts are columnar Transcript objects
+            stream: Whether to parse timedtext responses incrementally while they download
+            fmt: timedtext format to request ('srv1', 'srv3' or 'json3')
+            allow_manual: Whether manually created tracks may be used
+            allow_generated: Whether auto-generated tracks may be used
+            allow_translation: Whether tracks may be translated to a requested language
+
+        Yields:
+            Dictionaries with video_id, transcript and error keys
+        """
+        concurrent = max_workers is not None and max_workers > 1
+
+        # Size a dedicated pool so every worker can keep its own connection
+        owns_transport = concurrent and transport is None
+        if owns_transport:
+            transport = Transport(
+                pool_maxsize=max(max_workers, 10),
+                rate_limiter=get_default_rate_limiter()
+            )
+
+        fetch = partial(
+            cls.get_transcript,
+            languages=languages,
+            proxies=proxies,
+            cookies=cookies,
+            preserve_formatting=preserve_formatting,
+            transport=transport,
+            direct_innertube=direct_innertube,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            cache=cache,
+            track_cache=track_cache,
+            negative_cache=negative_cache,
+            compact=compact,
+            stream=stream,
+            fmt=fmt,
+            allow_manual=allow_manual,
+            allow_generated=allow_generated,
+            allow_translation=allow_translation
+        )
+
+        def result_record(video_id, get_result):
             try:
-                transcript = cls.get_transcript(
-                    video_id,
-                    languages=languages,
-                    proxies=proxies,
-                    cookies=cookies,
-                    preserve_formatting=preserve_formatting
-                )
-                results.append({
+                return {
                     'video_id': video_id,
-                    'transcript': transcript,
+                    'transcript': get_result(),
                     'error': None
-                })
+                }
             except Exception as e:
-                if continue_on_failure:
-                    results.append({
-                        'video_id': video_id,
-                        'transcript': None,
-                        'error': str(e)
-                    })
+                if not continue_on_failure:
+                    raise
+                return {
+                    'video_id': video_id,
+                    'transcript': None,
+                    'error': str(e)
+                }
+
+        if not concurrent:
+            for video_id in video_ids:
+                yield result_record(video_id, partial(fetch, video_id))
+            return
+
+        max_in_flight = max(max_in_flight or 2 * max_workers, 1)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        submission_order = deque()
+        video_id_iter = iter(video_ids)
+
+        def submit_until_full():
+            while len(pending) < max_in_flight:
+                video_id = next(video_id_iter, None)
+                if video_id is None:
+                    return
+                future = executor.submit(fetch, video_id)
+                pending[future] = video_id
+                submission_order.append(future)
+
+        try:
+            submit_until_full()
+            while pending:
+                if ordered:
+                    future = submission_order.popleft()
+                    futures_wait([future])
                 else:
-                    raise e
-                    
-        return results
+                    done, _ = futures_wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                    submission_order.remove(future)
+
+                video_id = pending.pop(future)
+                record = result_record(video_id, future.result)
+                # Refill before handing the record over so workers stay busy
+                submit_until_full()
+                yield record
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            if owns_transport:
+                transport.close()
 
     @classmethod
     def list_transcripts(
@@ -171,7 +523,12 @@ class YouTubeTranscriptApi:
         proxies: Dict = None,
         cookies: str = None,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        transport: Transport = None,
+        direct_innertube: bool = False,
+        retry_policy: RetryPolicy = None,
+        deadline: Deadline = None,
+        track_cache: TrackListCache = None
     ) -> TranscriptList:
         """
         List all available transcripts for a video.
@@ -180,90 +537,142 @@ class YouTubeTranscriptApi:
             video_id: YouTube video ID
             proxies: Proxy configuration for requests
             cookies: Cookie string for authentication
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            max_retries: Maximum number of retry attempts (ignored if retry_policy is given)
+            retry_delay: Delay between retries in seconds (ignored if retry_policy is given)
+            transport: Shared HTTP transport (defaults to the process-wide one)
+            direct_innertube: Call the Innertube player endpoint directly with the
+                cached API key and only download the watch page when no key is
+                cached or the direct call fails
+            retry_policy: RetryPolicy deciding which failures are retried and when
+            deadline: End-to-end Deadline shared with the later timedtext fetch
+            track_cache: TrackListCache answering repeat listings of the same
+                video without any network access
 
         Returns:
             TranscriptList object containing all available transcripts
         """
+        transport = transport or get_default_transport()
+
+        if track_cache is not None:
+            transcript_data = track_cache.get(video_id)
+            if transcript_data is not None:
+                return TranscriptList(
+                    video_id,
+                    transcript_data,
+                    proxies=proxies,
+                    cookies=cookies,
+                    transport=transport
+                )
+
+        retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
         last_exception = None
 
-        for attempt in range(max_retries + 1):
+        for attempt in range(retry_policy.max_retries + 1):
+            if deadline is not None:
+                deadline.check(video_id)
+
+            response = None
             try:
+                if direct_innertube:
+                    transcript_data = cls._fetch_transcript_data_direct(
+                        video_id,
+                        transport=transport,
+                        proxies=proxies,
+                        deadline=deadline
+                    )
+                    if transcript_data:
+                        if track_cache is not None:
+                            track_cache.set(video_id, transcript_data)
+                        return TranscriptList(
+                            video_id,
+                            transcript_data,
+                            proxies=proxies,
+                            cookies=cookies,
+                            transport=transport
+                        )
+
                 # First, get the video page to extract transcript data
                 watch_url = cls._WATCH_URL.format(video_id=video_id)
 
-                session = requests.Session()
-                if proxies:
-                    session.proxies.update(proxies)
-
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-
-                if cookies:
-                    headers['Cookie'] = cookies
-
-                response = session.get(watch_url, headers=headers, timeout=30)
+                response = transport.get(
+                    watch_url,
+                    headers=cls._WATCH_HEADERS,
+                    proxies=proxies,
+                    cookies=cookies,
+                    timeout=deadline.request_timeout(30) if deadline else 30
+                )
 
-                if response.status_code == 429:
-                    if attempt < max_retries:
-                        time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                        continue
-                    raise TooManyRequests(video_id)
-                elif response.status_code == 404:
+                if response.status_code == 404:
                     raise VideoUnavailable(video_id)
                 elif response.status_code != 200:
-                    if attempt < max_retries:
-                        time.sleep(retry_delay)
-                        continue
-                    raise VideoUnavailable(video_id)
-
-                # Extract transcript data from the page
-                transcript_data = cls._extract_transcript_data(response.text, video_id)
-
-                if not transcript_data:
-                    if attempt < max_retries:
-                        time.sleep(retry_delay)
-                        continue
-                    raise TranscriptNotFound(video_id)
-
-                return TranscriptList(video_id, transcript_data, proxies=proxies, cookies=cookies)
-
-            except (TranscriptRetrievalError, TooManyRequests, VideoUnavailable, TranscriptNotFound):
+                    # Only a 404 means the video is gone; other statuses (403, 5xx, ...)
+                    # may be transient and must not end up in a NegativeResultCache
+                    if response.status_code == 429:
+                        last_exception = TooManyRequests(video_id)
+                    else:
+                        last_exception = TranscriptRetrievalError(video_id, f"HTTP {response.status_code}")
+                    if not retry_policy.is_retryable_status(response.status_code):
+                        raise last_exception
+                else:
+                    # Extract transcript data from the page
+                    transcript_data = cls._extract_transcript_data(
+                        response.text,
+                        video_id,
+                        transport=transport,
+                        proxies=proxies,
+                        deadline=deadline
+                    )
+
+                    if transcript_data:
+                        if track_cache is not None:
+                            track_cache.set(video_id, transcript_data)
+                        return TranscriptList(
+                            video_id,
+                            transcript_data,
+                            proxies=proxies,
+                            cookies=cookies,
+                            transport=transport
+                        )
+
+                    last_exception = TranscriptNotFound(video_id)
+                    response = None
+
+            except TranscriptRetrievalError:
                 raise
             except requests.exceptions.Timeout as e:
                 last_exception = TranscriptRetrievalError(video_id, f"Request timeout: {str(e)}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
             except requests.exceptions.ConnectionError as e:
                 last_exception = TranscriptRetrievalError(video_id, f"Connection error: {str(e)}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
             except Exception as e:
                 last_exception = TranscriptRetrievalError(video_id, f"Failed to retrieve transcript list: {str(e)}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
+
+            if not retry_policy.sleep(attempt, response, deadline):
+                break
+
+        if deadline is not None:
+            deadline.check(video_id)
 
         # If all retries failed, raise the last exception
         raise last_exception or TranscriptRetrievalError(video_id, "Failed to retrieve transcript list after all retries")
 
     @classmethod
-    def _extract_transcript_data(cls, html_content: str, video_id: str) -> Dict:
+    def _extract_transcript_data(
+        cls,
+        html_content: str,
+        video_id: str,
+        transport: Transport = None,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ) -> Dict:
         """
         Extract transcript data from YouTube video page HTML.
 
         Args:
             html_content: HTML content of the video page
             video_id: YouTube video ID
+            transport: HTTP transport used for the Innertube request
+            proxies: Proxy configuration for requests
+            deadline: Deadline capping the Innertube request timeout
 
         Returns:
             Dictionary containing transcript data
@@ -272,7 +681,14 @@ class YouTubeTranscriptApi:
         try:
             api_key = cls._extract_innertube_api_key(html_content)
             if api_key:
-                innertube_data = cls._fetch_innertube_data(video_id, api_key)
+                cls._innertube_key_cache.set(api_key)
+                innertube_data = cls._fetch_innertube_data(
+                    video_id,
+                    api_key,
+                    transport=transport,
+                    proxies=proxies,
+                    deadline=deadline
+                )
                 if innertube_data:
                     captions_data = cls._extract_captions_from_innertube(innertube_data)
                     if captions_data:
@@ -280,31 +696,81 @@ class YouTubeTranscriptApi:
         except Exception:
             pass  # Fallback to HTML parsing
 
-        # Fallback: Look for captions data in the HTML with improved patterns
-        patterns = [
-            # Modern YouTube patterns
-            r'"captions":\s*\{[^}]*"playerCaptionsTracklistRenderer":\s*(\{.*?\})',
-            r'"playerCaptionsTracklistRenderer":\s*(\{.*?"captionTracks".*?\})',
-            r'ytInitialPlayerResponse["\']?:\s*(\{.*?\})',
-            r'var\s+ytInitialPlayerResponse\s*=\s*(\{.*?\});',
-            # Alternative patterns for different YouTube layouts
-            r'"captionTracks":\s*\[(.*?)\]',
-            r'"playerCaptionsRenderer":\s*(\{.*?\})',
-            # Backup patterns
-            r'"captions":(\{.*?"playerCaptionsTracklistRenderer".*?\})',
-            r'ytInitialPlayerResponse":\s*(\{.*?\})\s*[,}]'
-        ]
+        return cls._extract_transcript_data_from_html(html_content, video_id)
 
-        for pattern in patterns:
-            match = re.search(pattern, html_content)
-            if match:
-                try:
-                    data = json.loads(match.group(1))
-                    captions_data = cls._find_captions_data(data)
-                    if captions_data:
-                        return cls._parse_transcript_data(captions_data, video_id)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    @classmethod
+    def _fetch_transcript_data_direct(
+        cls,
+        video_id: str,
+        transport: Transport = None,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ) -> Optional[Dict]:
+        """
+        Fetch transcript data from the Innertube player endpoint with the cached API key.
+
+        Args:
+            video_id: YouTube video ID
+            transport: HTTP transport to send the request with
+            proxies: Proxy configuration for requests
+            deadline: Deadline capping the request timeout
+
+        Returns:
+            Dictionary containing transcript data, or None if the watch page is
+            needed (no cached key, the key was rejected, or no captions were found)
+        """
+        api_key = cls._innertube_key_cache.get()
+        if not api_key:
+            return None
+
+        response = cls._post_innertube_player(
+            video_id,
+            api_key,
+            transport=transport,
+            proxies=proxies,
+            deadline=deadline
+        )
+        if response is None or response.status_code != 200:
+            # Only a rejected key is dropped (it may have been rotated; the next
+            # watch page refreshes it); timeouts, connection errors and 429s
+            # say nothing about the key
+            if response is not None and response.status_code in cls._REJECTED_KEY_STATUSES:
+                cls._innertube_key_cache.invalidate(api_key)
+            return None
+
+        try:
+            innertube_data = response.json()
+        except ValueError:
+            return None
+
+        captions_data = cls._extract_captions_from_innertube(innertube_data)
+        if captions_data:
+            return cls._parse_transcript_data(captions_data, video_id)
+        return None
+
+    @classmethod
+    def _extract_transcript_data_from_html(cls, html_content: str, video_id: str) -> Dict:
+        """
+        Extract transcript data embedded in the video page HTML, without any network access.
+
+        Args:
+            html_content: HTML content of the video page
+            video_id: YouTube video ID
+
+        Returns:
+            Dictionary containing transcript data
+        """
+        # Decode exactly the embedded player response object in one linear scan
+        player_response = extract_json_object(html_content, 'ytInitialPlayerResponse')
+        if player_response:
+            captions_data = cls._find_captions_data(player_response)
+            if captions_data:
+                return cls._parse_transcript_data(captions_data, video_id)
+
+        # Some layouts only embed the caption renderer itself
+        captions_data = extract_json_object(html_content, '"playerCaptionsTracklistRenderer"')
+        if captions_data and captions_data.get('captionTracks'):
+            return cls._parse_transcript_data(captions_data, video_id)
 
         # If no captions found in initial data, try alternative extraction
         return cls._extract_alternative_transcript_data(html_content, video_id)
@@ -343,7 +809,8 @@ class YouTubeTranscriptApi:
         transcript_data = {}
         
         caption_tracks = captions_data.get('captionTracks', [])
-        translation_languages = captions_data.get('translationLanguages', [])
+        # One shared table for all tracks instead of a copy per track
+        translation_languages = TranslationLanguages.from_captions(captions_data.get('translationLanguages', []))
         
         for track in caption_tracks:
             language_code = track.get('languageCode', 'unknown')
@@ -361,17 +828,9 @@ class YouTubeTranscriptApi:
                 'url': base_url,
                 'is_generated': is_auto,
                 'is_translatable': bool(translation_languages),
-                'translation_languages': []
+                'translation_languages': translation_languages
             }
             
-            # Add translation languages if available
-            if translation_languages:
-                for lang in translation_languages:
-                    transcript_info['translation_languages'].append({
-                        'language_code': lang.get('languageCode', ''),
-                        'language': lang.get('languageName', {}).get('simpleText', '')
-                    })
-            
             if language_code not in transcript_data:
                 transcript_data[language_code] = []
             transcript_data[language_code].append(transcript_info)
@@ -403,25 +862,77 @@ class YouTubeTranscriptApi:
         return None
 
     @classmethod
-    def _fetch_innertube_data(cls, video_id: str, api_key: str) -> Optional[Dict]:
+    def _fetch_innertube_data(
+        cls,
+        video_id: str,
+        api_key: str,
+        transport: Transport = None,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ) -> Optional[Dict]:
         """
         Fetch transcript data from YouTube Innertube API.
 
         Args:
             video_id: YouTube video ID
             api_key: Innertube API key
+            transport: HTTP transport to send the request with
+            proxies: Proxy configuration for requests
+            deadline: Deadline capping the request timeout
 
         Returns:
             Innertube response data or None if failed
         """
-        url = f"https://www.youtube.com/youtubei/v1/player?key={api_key}"
+        response = cls._post_innertube_player(
+            video_id,
+            api_key,
+            transport=transport,
+            proxies=proxies,
+            deadline=deadline
+        )
+        try:
+            if response is not None and response.status_code == 200:
+                return response.json()
+        except Exception:
+            pass
 
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+        return None
 
-        data = {
+    @classmethod
+    def _post_innertube_player(
+        cls,
+        video_id: str,
+        api_key: str,
+        transport: Transport = None,
+        proxies: Dict = None,
+        deadline: Deadline = None
+    ):
+        """
+        Send the Innertube player request.
+
+        Returns:
+            The response, or None if the request itself failed (timeout,
+            connection error)
+        """
+        transport = transport or get_default_transport()
+
+        try:
+            return transport.post(
+                cls._INNERTUBE_PLAYER_URL.format(api_key=api_key),
+                headers=cls._INNERTUBE_HEADERS,
+                json=cls._innertube_player_payload(video_id),
+                proxies=proxies,
+                timeout=deadline.request_timeout(30) if deadline else None
+            )
+        except Exception:
+            return None
+
+    @classmethod
+    def _innertube_player_payload(cls, video_id: str) -> Dict:
+        """
+        Build the request body for the Innertube player endpoint.
+        """
+        return {
             "context": {
                 "client": {
                     "clientName": "WEB",
@@ -431,15 +942,6 @@ class YouTubeTranscriptApi:
             "videoId": video_id
         }
 
-        try:
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code == 200:
-                return response.json()
-        except Exception:
-            pass
-
-        return None
-
     @classmethod
     def _extract_captions_from_innertube(cls, innertube_data: Dict) -> Optional[Dict]:
         """